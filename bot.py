@@ -47,7 +47,13 @@ class FunniGuyBot(commands.Bot):
         super().__init__(
             command_prefix='fg ',
             intents=intents,
-            help_command=None  # We'll create custom help
+            help_command=None,  # We'll create custom help
+            # Only user mentions ping; skips @everyone/role resolution on every send
+            allowed_mentions=discord.AllowedMentions(everyone=False, roles=False, users=True, replied_user=False),
+            # Members are cached as they show up instead of chunking every guild on connect
+            chunk_guilds_at_startup=False,
+            # Use Discord's reset-after header for rate limits instead of the local clock
+            assume_unsync_clock=True
         )
         
         # Initialize data manager
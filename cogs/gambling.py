@@ -4,227 +4,378 @@ Contains all gambling and minigame commands like blackjack, slots, gamble, etc.
 """
 import discord
 from discord.ext import commands
+import os
 import random
 import asyncio
-from typing import Optional, List
+from collections import Counter
+from types import MappingProxyType
+from typing import Optional, Tuple
 import logging
 
 from utils.embeds import create_success_embed, create_error_embed, create_info_embed
+from utils.economy_manager import TransactionType
+from utils.views import PickView
 
 logger = logging.getLogger(__name__)
 
+# Shared generator for the unwagered games; bound methods skip the module-level indirection
+_RNG = random.Random()
+_randint = _RNG.randint
+_choice = _RNG.choice
+
+
+def _seed_game() -> Tuple[int, random.Random]:
+    """Return a fresh os.urandom seed and a generator of its own for one wagered game, so the seed replays it"""
+    seed = int.from_bytes(os.urandom(8), "big")
+    return seed, random.Random(seed)
+
+class _AliasSampler:
+    """Constant-time weighted draws from a fixed table (Walker's alias method)"""
+    
+    __slots__ = ("items", "prob", "alias", "size")
+    
+    def __init__(self, items, weights):
+        size = len(items)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        prob = [1.0] * size
+        alias = list(range(size))
+        
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            prob[low] = scaled[low]
+            alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+            
+        self.items = tuple(items)
+        self.prob = tuple(prob)
+        self.alias = tuple(alias)
+        self.size = size
+        
+    def sample(self, rng: random.Random):
+        # One uniform picks the column and, from its fractional part, the side
+        u = rng.random() * self.size
+        i = int(u)
+        return self.items[i] if u - i < self.prob[i] else self.items[self.alias[i]]
+
+
+# Slot machine symbols with different rarities
+_SLOT_SYMBOLS = ("🍒", "🍋", "🍊", "🍇", "🔔", "💎", "7️⃣")
+_SLOT_WEIGHTS = (30, 25, 20, 15, 7, 2, 1)  # Rarer symbols have lower weights
+_SLOT_SAMPLER = _AliasSampler(_SLOT_SYMBOLS, _SLOT_WEIGHTS)
+_SLOT_MULTIPLIERS = MappingProxyType({
+    "🍒": 10, "🍋": 15, "🍊": 20, "🍇": 25,
+    "🔔": 50, "💎": 100, "7️⃣": 777
+})
+_SLOT_TEMPLATE = "```╔═══════════╗\n║ {} ║ {} ║ {} ║\n╚═══════════╝```"
+
+# Standard 52-card deck as (rank, suit) pairs
+_BJ_SUITS = ("♠️", "♥️", "♦️", "♣️")
+_BJ_RANKS = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+_BJ_DECK = tuple((rank, suit) for suit in _BJ_SUITS for rank in _BJ_RANKS)
+_BJ_CARD_STRINGS = MappingProxyType({card: f"{card[0]}{card[1]}" for card in _BJ_DECK})
+_BJ_CARD_VALUES = MappingProxyType({
+    "A": 11, "J": 10, "Q": 10, "K": 10,
+    **{str(i): i for i in range(2, 11)}
+})
+# Most cards a hand can use: 2 for the player plus up to 10 for the dealer
+# (2 2 2 2 3 A A A A 3 is the longest a dealer can draw before reaching 17)
+_BJ_MAX_CARDS = 12
+
+# Scratch card symbols and payouts indexed by number of matches
+_SCRATCH_SYMBOLS = ("💰", "💎", "🎰", "🍒", "🔔", "⭐", "💸")
+_SCRATCH_INDEX = MappingProxyType({symbol: i for i, symbol in enumerate(_SCRATCH_SYMBOLS)})
+_SCRATCH_PAYOUTS = (
+    (0, 0, 0, 5, 20, 100),    # 💰 3=5x, 4=20x, 5=100x
+    (0, 0, 0, 10, 50, 500),   # 💎 3=10x, 4=50x, 5=500x
+    (0, 0, 0, 3, 15, 75),     # 🎰 3=3x, 4=15x, 5=75x
+    (0, 0, 0, 4, 18, 90),     # 🍒 etc.
+    (0, 0, 0, 6, 25, 125),    # 🔔
+    (0, 0, 0, 8, 35, 175),    # ⭐
+    (0, 0, 0, 2, 10, 50),     # 💸 Lowest payout
+)
+# Six or more matches on the nine-cell card pay the five-match rate
+_SCRATCH_MULT = tuple(row + (row[-1],) * 4 for row in _SCRATCH_PAYOUTS)
+_SCRATCH_TEMPLATE = "```{} | {} | {}\n{} | {} | {}\n{} | {} | {}```"
+
+_RPS_EMOJIS = MappingProxyType({"rock": "✊", "paper": "🖐️", "scissors": "✌️"})
+_RPS_CHOICES = tuple(_RPS_EMOJIS)
+
+# Static bet validation errors, built once and re-sent: (missing amount, non-positive amount)
+_BET_ERRORS = MappingProxyType({
+    name: (
+        create_error_embed(f"You need to specify an amount to {verb}!\nUsage: `fg {name} <amount>`", timestamp=False),
+        create_error_embed(f"You need to {verb} a positive amount!", timestamp=False),
+    )
+    for name, verb in (
+        ("gamble", "gamble"), ("slots", "bet"), ("blackjack", "bet"),
+        ("highlow", "bet"), ("scratch", "bet"),
+    )
+})
+
+_LOTTERY_RANGE_ERROR = create_error_embed(
+    "You can buy 1-10 lottery tickets at a time!\nUsage: `fg lottery <1-10>`", timestamp=False
+)
+# Sent when settlement fails, e.g. another game drained the pocket after the bet was validated
+_SETTLE_FAILED_ERROR = create_error_embed(
+    "This bet couldn't be settled - your pocket may no longer cover it. No coins were moved.", timestamp=False
+)
+_HL_TIMEOUT_ERROR = create_error_embed("⏰ You took too long to guess! Game cancelled.", timestamp=False)
+_RPS_TIMEOUT_ERROR = create_error_embed("⏰ You took too long to choose! Game cancelled.", timestamp=False)
+_TRIVIA_TIMEOUT_ERROR = create_error_embed("⏰ Time's up! You took too long to answer.", timestamp=False)
+
+_TRIVIA_QUESTIONS = (
+    MappingProxyType({"q": "What is 2 + 2?", "answers": ("4", "four"), "reward": 100}),
+    MappingProxyType({"q": "What planet is closest to the Sun?", "answers": ("mercury",), "reward": 150}),
+    MappingProxyType({"q": "How many sides does a triangle have?", "answers": ("3", "three"), "reward": 100}),
+    MappingProxyType({"q": "What is the capital of France?", "answers": ("paris",), "reward": 200}),
+    MappingProxyType({"q": "What color do you get when you mix red and blue?", "answers": ("purple", "violet"), "reward": 150}),
+)
+
+
+def _message_check(author, channel):
+    """Build a wait_for predicate accepting author's messages in channel"""
+    return lambda m: m.author == author and m.channel == channel
+
+
+class HighLowView(PickView):
+    """Higher/lower buttons for the highlow game"""
+    
+    @discord.ui.button(label="Higher", emoji="⬆️", style=discord.ButtonStyle.success)
+    async def higher(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._pick(interaction, "⬆️")
+        
+    @discord.ui.button(label="Lower", emoji="⬇️", style=discord.ButtonStyle.danger)
+    async def lower(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._pick(interaction, "⬇️")
+
+
+class RPSView(PickView):
+    """Rock/paper/scissors buttons"""
+    
+    @discord.ui.button(label="Rock", emoji="✊", style=discord.ButtonStyle.secondary)
+    async def rock(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._pick(interaction, "rock")
+        
+    @discord.ui.button(label="Paper", emoji="🖐️", style=discord.ButtonStyle.secondary)
+    async def paper(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._pick(interaction, "paper")
+        
+    @discord.ui.button(label="Scissors", emoji="✌️", style=discord.ButtonStyle.secondary)
+    async def scissors(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._pick(interaction, "scissors")
+
 
 class Gambling(commands.Cog):
     """Gambling and minigame commands"""
     
     def __init__(self, bot):
         self.bot = bot
-
-    @commands.command(name="gamble", aliases=["bet"])
-    @commands.cooldown(1, 300, commands.BucketType.user)  # 5 minute cooldown
-    async def gamble_command(self, ctx: commands.Context, amount: int = None):
-        """Gamble coins with a dice roll"""
+        
+    async def _validate_bet(self, ctx: commands.Context, amount: Optional[int], cmd_name: str) -> Optional[int]:
+        """Return the author's pocket balance if the bet is valid, otherwise send the error and return None"""
+        missing_embed, non_positive_embed = _BET_ERRORS[cmd_name]
         if amount is None:
-            embed = create_error_embed("You need to specify an amount to gamble!\nUsage: `fg gamble <amount>`")
-            await ctx.send(embed=embed)
-            return
+            await ctx.send(embed=missing_embed)
+            return None
             
         if amount <= 0:
-            embed = create_error_embed("You need to gamble a positive amount!")
-            await ctx.send(embed=embed)
-            return
+            await ctx.send(embed=non_positive_embed)
+            return None
             
-        user_id = ctx.author.id
-        pocket, _ = await self.bot.data_manager.get_balance(user_id)
+        pocket, _ = await self.bot.data_manager.get_balance(ctx.author.id)
         
         if amount > pocket:
             embed = create_error_embed(f"You don't have {amount} coins in your pocket!")
             await ctx.send(embed=embed)
+            return None
+            
+        return pocket
+        
+    async def _settle_bet(self, user_id: int, wager: int, delta: int, reason: str, seed: int) -> bool:
+        """Apply a game's net result as one gambling transaction tagged with its seed; False if it couldn't be applied"""
+        return await self.bot.data_manager.economy.apply_delta(
+            user_id, delta, "pocket",
+            transaction_type=TransactionType.EARN_GAMBLING if delta > 0 else TransactionType.SPEND_GAMBLING,
+            description=f"{reason} [seed {seed:016x}]",
+            wager=wager
+        )
+
+    @commands.command(name="gamble", aliases=["bet"])
+    @commands.cooldown(1, 300, commands.BucketType.user)  # 5 minute cooldown
+    async def gamble_command(self, ctx: commands.Context, amount: int = None):
+        """Gamble coins with a dice roll"""
+        pocket = await self._validate_bet(ctx, amount, "gamble")
+        if pocket is None:
             return
             
+        user_id = ctx.author.id
+        seed, rng = _seed_game()
+            
         # Roll dice
-        user_roll = random.randint(1, 6)
-        bot_roll = random.randint(1, 6)
+        user_roll = rng.randint(1, 6)
+        bot_roll = rng.randint(1, 6)
         
         embed = discord.Embed(title="🎲 Gambling Results", color=discord.Color.gold())
-        embed.add_field(name="Your Roll", value=f"🎲 {user_roll}", inline=True)
-        embed.add_field(name="Bot Roll", value=f"🎲 {bot_roll}", inline=True)
         
-        # Deduct bet upfront
-        await self.bot.data_manager.economy.remove_coins(user_id, amount, "pocket", f"Gambling bet ({amount})")
+        # The bet and any payout settle as one net balance change before the reply
+        delta, reason = 0, None
         
         if user_roll > bot_roll:
             # User wins - pay 1.8x their bet (net profit = 0.8x)
             winnings = int(amount * 1.8)
-            await self.bot.data_manager.economy.add_coins(user_id, winnings, "pocket", f"Gambling win ({amount} bet)")
+            delta, reason = winnings - amount, f"Gambling win ({amount} bet)"
             
-            embed.add_field(name="Result", value=f"🎉 **YOU WON!**\nYou won **{winnings}** coins!", inline=False)
+            result = f"🎉 **YOU WON!**\nYou won **{winnings}** coins!"
             embed.color = discord.Color.green()
             
         elif user_roll == bot_roll:
-            # Tie - return bet
-            await self.bot.data_manager.economy.add_coins(user_id, amount, "pocket", f"Gambling tie ({amount} bet)")
-            embed.add_field(name="Result", value=f"🤝 **TIE!**\nYou get your **{amount}** coins back!", inline=False)
+            # Tie - bet is returned, so the balance is unchanged
+            reason = f"Gambling tie ({amount} bet)"
+            result = f"🤝 **TIE!**\nYou get your **{amount}** coins back!"
             embed.color = discord.Color.orange()
             
         else:
-            # User loses - bet already deducted
-            embed.add_field(name="Result", value=f"💸 **YOU LOST!**\nYou lost **{amount}** coins!", inline=False)
+            # User loses the bet
+            delta, reason = -amount, f"Gambling loss ({amount} bet)"
+            result = f"💸 **YOU LOST!**\nYou lost **{amount}** coins!"
             embed.color = discord.Color.red()
             
+        # Rolls and result share the description rather than three separate fields
+        embed.description = f"🎲 Your Roll: **{user_roll}** vs Bot Roll: **{bot_roll}**\n\n{result}"
+        
+        if not await self._settle_bet(user_id, amount, delta, reason, seed):
+            await ctx.send(embed=_SETTLE_FAILED_ERROR)
+            return
+            
         await ctx.send(embed=embed)
 
     @commands.command(name="slots")
     @commands.cooldown(1, 180, commands.BucketType.user)  # 3 minute cooldown
     async def slots_command(self, ctx: commands.Context, amount: int = None):
         """Play the slot machine"""
-        if amount is None:
-            embed = create_error_embed("You need to specify an amount to bet!\nUsage: `fg slots <amount>`")
-            await ctx.send(embed=embed)
-            return
-            
-        if amount <= 0:
-            embed = create_error_embed("You need to bet a positive amount!")
-            await ctx.send(embed=embed)
+        pocket = await self._validate_bet(ctx, amount, "slots")
+        if pocket is None:
             return
             
         user_id = ctx.author.id
-        pocket, _ = await self.bot.data_manager.get_balance(user_id)
-        
-        if amount > pocket:
-            embed = create_error_embed(f"You don't have {amount} coins in your pocket!")
-            await ctx.send(embed=embed)
-            return
+        seed, rng = _seed_game()
             
-        # Slot machine symbols with different rarities
-        symbols = ["🍒", "🍋", "🍊", "🍇", "🔔", "💎", "7️⃣"]
-        weights = [30, 25, 20, 15, 7, 2, 1]  # Rarer symbols have lower weights
-        
-        # Spin the slots
-        slot1 = random.choices(symbols, weights=weights)[0]
-        slot2 = random.choices(symbols, weights=weights)[0] 
-        slot3 = random.choices(symbols, weights=weights)[0]
+        # Spin the slots (weighted draws from the precomputed alias table)
+        spin = _SLOT_SAMPLER.sample
+        slot1, slot2, slot3 = spin(rng), spin(rng), spin(rng)
         
         embed = discord.Embed(title="🎰 Slot Machine", color=discord.Color.gold())
         
-        # Display the slots
-        slot_display = f"╔═══════════╗\n║ {slot1} ║ {slot2} ║ {slot3} ║\n╚═══════════╝"
-        embed.add_field(name="Spin Results", value=f"```{slot_display}```", inline=False)
+        # Calculate winnings (1 distinct symbol = jackpot, 2 = two match, 3 = no match)
+        delta, reason = 0, None
+        unique = len({slot1, slot2, slot3})
         
-        # Calculate winnings
-        if slot1 == slot2 == slot3:
+        if unique == 1:
             # Jackpot - all three match
-            multipliers = {
-                "🍒": 10, "🍋": 15, "🍊": 20, "🍇": 25, 
-                "🔔": 50, "💎": 100, "7️⃣": 777
-            }
-            multiplier = multipliers.get(slot1, 10)
+            multiplier = _SLOT_MULTIPLIERS.get(slot1, 10)
             winnings = amount * multiplier
             
-            await self.bot.data_manager.economy.add_coins(user_id, winnings, "pocket", f"Slots jackpot ({amount} bet)")
+            delta, reason = winnings, f"Slots jackpot ({amount} bet)"
             
-            embed.add_field(name="Result", value=f"🎊 **JACKPOT!** 🎊\nTriple {slot1}!\nYou won **{winnings}** coins!", inline=False)
+            result = f"🎊 **JACKPOT!** 🎊\nTriple {slot1}!\nYou won **{winnings}** coins!"
             embed.color = discord.Color.gold()
             
-        elif slot1 == slot2 or slot2 == slot3 or slot1 == slot3:
+        elif unique == 2:
             # Two match - small win
             winnings = int(amount * 2)
-            await self.bot.data_manager.economy.add_coins(user_id, winnings, "pocket", f"Slots win ({amount} bet)")
+            delta, reason = winnings, f"Slots win ({amount} bet)"
             
-            embed.add_field(name="Result", value=f"🎉 **TWO MATCH!**\nYou won **{winnings}** coins!", inline=False)
+            result = f"🎉 **TWO MATCH!**\nYou won **{winnings}** coins!"
             embed.color = discord.Color.green()
             
         else:
             # No match - lose bet
-            await self.bot.data_manager.economy.remove_coins(user_id, amount, "pocket", f"Slots loss ({amount} bet)")
+            delta, reason = -amount, f"Slots loss ({amount} bet)"
             
-            embed.add_field(name="Result", value=f"💸 **NO MATCH!**\nYou lost **{amount}** coins!", inline=False)
+            result = f"💸 **NO MATCH!**\nYou lost **{amount}** coins!"
             embed.color = discord.Color.red()
             
+        # Display the slots and the result together
+        embed.description = _SLOT_TEMPLATE.format(slot1, slot2, slot3) + "\n" + result
+        
+        if not await self._settle_bet(user_id, amount, delta, reason, seed):
+            await ctx.send(embed=_SETTLE_FAILED_ERROR)
+            return
+            
         await ctx.send(embed=embed)
 
     @commands.command(name="blackjack", aliases=["bj"])
     @commands.cooldown(1, 240, commands.BucketType.user)  # 4 minute cooldown
     async def blackjack_command(self, ctx: commands.Context, amount: int = None):
         """Play blackjack against the bot"""
-        if amount is None:
-            embed = create_error_embed("You need to specify an amount to bet!\nUsage: `fg blackjack <amount>`")
-            await ctx.send(embed=embed)
-            return
-            
-        if amount <= 0:
-            embed = create_error_embed("You need to bet a positive amount!")
-            await ctx.send(embed=embed)
+        pocket = await self._validate_bet(ctx, amount, "blackjack")
+        if pocket is None:
             return
             
         user_id = ctx.author.id
-        pocket, _ = await self.bot.data_manager.get_balance(user_id)
-        
-        if amount > pocket:
-            embed = create_error_embed(f"You don't have {amount} coins in your pocket!")
-            await ctx.send(embed=embed)
-            return
+        seed, rng = _seed_game()
             
-        # Create deck
-        suits = ["♠️", "♥️", "♦️", "♣️"]
-        ranks = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
-        deck = [(rank, suit) for suit in suits for rank in ranks]
-        random.shuffle(deck)
+        # Draw only as many cards as the hand can possibly use
+        deck = rng.sample(_BJ_DECK, _BJ_MAX_CARDS)
         
         # Deal initial cards
         player_cards = [deck.pop(), deck.pop()]
         dealer_cards = [deck.pop(), deck.pop()]
         
-        def card_value(card):
-            rank = card[0]
-            if rank in ["J", "Q", "K"]:
-                return 10
-            elif rank == "A":
-                return 11
-            else:
-                return int(rank)
-                
         def hand_value(cards):
-            value = sum(card_value(card) for card in cards)
-            aces = sum(1 for card in cards if card[0] == "A")
-            
+            """Return (value, soft_aces) where soft_aces are aces still counted as 11"""
+            value = 0
+            aces = 0
+            for rank, _ in cards:
+                value += _BJ_CARD_VALUES[rank]
+                if rank == "A":
+                    aces += 1
+                    
+
             # Adjust for aces
             while value > 21 and aces > 0:
                 value -= 10
                 aces -= 1
                 
-            return value
+            return value, aces
             
         def format_cards(cards, hide_first=False):
             if hide_first:
-                return f"🎴 {cards[1][0]}{cards[1][1]}"
+                return f"🎴 {_BJ_CARD_STRINGS[cards[1]]}"
             else:
-                return " ".join(f"{card[0]}{card[1]}" for card in cards)
+                return " ".join(_BJ_CARD_STRINGS[card] for card in cards)
                 
-        player_value = hand_value(player_cards)
-        dealer_value = hand_value(dealer_cards)
+        player_value, _ = hand_value(player_cards)
+        dealer_value, dealer_aces = hand_value(dealer_cards)
         
         embed = discord.Embed(title="♠️ Blackjack", color=discord.Color.blue())
         embed.add_field(name="Your Cards", value=f"{format_cards(player_cards)} (Value: {player_value})", inline=False)
         embed.add_field(name="Dealer Cards", value=f"{format_cards(dealer_cards, hide_first=True)} (Hidden)", inline=False)
         
         # Check for blackjacks
+        delta, reason = 0, None
+        
         if player_value == 21 and dealer_value == 21:
             # Both blackjack - tie
+            reason = f"Blackjack push ({amount} bet)"
             embed.add_field(name="Result", value="🤝 **PUSH!** Both blackjack!", inline=False)
             embed.color = discord.Color.orange()
             
         elif player_value == 21:
             # Player blackjack
             winnings = int(amount * 2.5)
-            await self.bot.data_manager.economy.add_coins(user_id, winnings, "pocket", f"Blackjack win ({amount} bet)")
+            delta, reason = winnings, f"Blackjack win ({amount} bet)"
             
             embed.add_field(name="Result", value=f"🎊 **BLACKJACK!**\nYou won **{winnings}** coins!", inline=False)
             embed.color = discord.Color.gold()
             
         elif dealer_value == 21:
             # Dealer blackjack
-            await self.bot.data_manager.economy.remove_coins(user_id, amount, "pocket", f"Blackjack loss ({amount} bet)")
+            delta, reason = -amount, f"Blackjack loss ({amount} bet)"
             
             embed.add_field(name="Dealer Cards", value=f"{format_cards(dealer_cards)} (Value: {dealer_value})", inline=False)
             embed.add_field(name="Result", value=f"💸 **DEALER BLACKJACK!**\nYou lost **{amount}** coins!", inline=False)
@@ -233,63 +384,65 @@ class Gambling(commands.Cog):
         else:
             # Continue game - simplified (no hit/stand for now)
             # Dealer plays automatically
+            # Keep a running total instead of rescoring the whole hand per hit
             while dealer_value < 17:
-                dealer_cards.append(deck.pop())
-                dealer_value = hand_value(dealer_cards)
+                card = deck.pop()
+                dealer_cards.append(card)
+                dealer_value += _BJ_CARD_VALUES[card[0]]
+                if card[0] == "A":
+                    dealer_aces += 1
+                while dealer_value > 21 and dealer_aces > 0:
+                    dealer_value -= 10
+                    dealer_aces -= 1
                 
             embed.add_field(name="Dealer Final", value=f"{format_cards(dealer_cards)} (Value: {dealer_value})", inline=False)
             
             if dealer_value > 21:
                 # Dealer bust
                 winnings = amount * 2
-                await self.bot.data_manager.economy.add_coins(user_id, winnings, "pocket", f"Blackjack win ({amount} bet)")
+                delta, reason = winnings, f"Blackjack win ({amount} bet)"
                 embed.add_field(name="Result", value=f"🎉 **DEALER BUST!**\nYou won **{winnings}** coins!", inline=False)
                 embed.color = discord.Color.green()
                 
             elif player_value > dealer_value:
                 # Player wins
                 winnings = amount * 2
-                await self.bot.data_manager.economy.add_coins(user_id, winnings, "pocket", f"Blackjack win ({amount} bet)")
+                delta, reason = winnings, f"Blackjack win ({amount} bet)"
                 embed.add_field(name="Result", value=f"🎉 **YOU WIN!**\nYou won **{winnings}** coins!", inline=False)
                 embed.color = discord.Color.green()
                 
             elif player_value == dealer_value:
                 # Push
+                reason = f"Blackjack push ({amount} bet)"
                 embed.add_field(name="Result", value="🤝 **PUSH!** Same value!", inline=False)
                 embed.color = discord.Color.orange()
                 
             else:
                 # Dealer wins
-                await self.bot.data_manager.economy.remove_coins(user_id, amount, "pocket", f"Blackjack loss ({amount} bet)")
+                delta, reason = -amount, f"Blackjack loss ({amount} bet)"
                 embed.add_field(name="Result", value=f"💸 **DEALER WINS!**\nYou lost **{amount}** coins!", inline=False)
                 embed.color = discord.Color.red()
                 
+        if not await self._settle_bet(user_id, amount, delta, reason, seed):
+            await ctx.send(embed=_SETTLE_FAILED_ERROR)
+            return
+            
         await ctx.send(embed=embed)
 
     @commands.command(name="highlow", aliases=["hl"])
     @commands.cooldown(1, 120, commands.BucketType.user)  # 2 minute cooldown
     async def highlow_command(self, ctx: commands.Context, amount: int = None):
         """Guess if the next number will be higher or lower"""
-        if amount is None:
-            embed = create_error_embed("You need to specify an amount to bet!\nUsage: `fg highlow <amount>`")
-            await ctx.send(embed=embed)
-            return
-            
-        if amount <= 0:
-            embed = create_error_embed("You need to bet a positive amount!")
-            await ctx.send(embed=embed)
+        pocket = await self._validate_bet(ctx, amount, "highlow")
+        if pocket is None:
             return
             
         user_id = ctx.author.id
-        pocket, _ = await self.bot.data_manager.get_balance(user_id)
-        
-        if amount > pocket:
-            embed = create_error_embed(f"You don't have {amount} coins in your pocket!")
-            await ctx.send(embed=embed)
-            return
+        seed, rng = _seed_game()
             
-        # Generate first number
-        first_number = random.randint(1, 100)
+        # Draw both numbers up front so the game's seed alone reproduces them
+        first_number = rng.randint(1, 100)
+        second_number = rng.randint(1, 100)
         
         embed = discord.Embed(
             title="🔢 High or Low",
@@ -297,160 +450,115 @@ class Gambling(commands.Cog):
             color=discord.Color.blue()
         )
         embed.add_field(name="Your Bet", value=f"{amount} coins", inline=True)
-        embed.set_footer(text="React with ⬆️ for HIGHER or ⬇️ for LOWER")
+        embed.set_footer(text="Press ⬆️ for HIGHER or ⬇️ for LOWER")
         
-        message = await ctx.send(embed=embed)
-        
-        # Add reactions
-        await message.add_reaction("⬆️")
-        await message.add_reaction("⬇️")
-        
-        def check(reaction, user):
-            return (user == ctx.author and 
-                   str(reaction.emoji) in ["⬆️", "⬇️"] and 
-                   reaction.message == message)
+        view = HighLowView(ctx.author)
+        message = await ctx.send(embed=embed, view=view)
         
         try:
-            reaction, _ = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
+            if await view.wait():
+                raise asyncio.TimeoutError
+                
+            # Determine result
+            user_guess = view.choice
+            correct = (
+                (second_number > first_number and user_guess == "⬆️") or
+                (second_number < first_number and user_guess == "⬇️")
+            )
+            delta, reason = 0, None
             
-            # Generate second number
-            second_number = random.randint(1, 100)
+            # Turn the prompt embed into the results embed in place
+            embed.title = "🔢 High or Low - Results"
+            embed.clear_fields()
+            embed.remove_footer()
+            numbers = f"First number: **{first_number}**\nSecond number: **{second_number}**\n\n"
             
-            # Determine result
-            user_guess = str(reaction.emoji)
-            correct = False
-            
-            if second_number > first_number and user_guess == "⬆️":
-                correct = True
-            elif second_number < first_number and user_guess == "⬇️":
-                correct = True
-            elif second_number == first_number:
+            if second_number == first_number:
                 # Same number - special case
-                embed = discord.Embed(
-                    title="🔢 High or Low - Results",
-                    description=f"First number: **{first_number}**\nSecond number: **{second_number}**\n\n🤯 **SAME NUMBER!** That's crazy!\nYou get your bet back plus a bonus!",
-                    color=discord.Color.gold()
-                )
+                embed.description = numbers + "🤯 **SAME NUMBER!** That's crazy!\nYou get your bet back plus a bonus!"
+                embed.color = discord.Color.gold()
                 
                 bonus = amount // 2
-                await self.bot.data_manager.economy.add_coins(user_id, bonus, "pocket", f"High-Low same number bonus ({amount} bet)")
+                delta, reason = bonus, f"High-Low same number bonus ({amount} bet)"
                 embed.add_field(name="Result", value=f"🎉 Bonus: **{bonus}** coins!", inline=False)
                 
             elif correct:
                 # User guessed correctly
                 winnings = amount * 2
-                await self.bot.data_manager.economy.add_coins(user_id, winnings, "pocket", f"High-Low win ({amount} bet)")
+                delta, reason = winnings, f"High-Low win ({amount} bet)"
                 
-                embed = discord.Embed(
-                    title="🔢 High or Low - Results",
-                    description=f"First number: **{first_number}**\nSecond number: **{second_number}**\n\n🎉 **CORRECT!**\nYou won **{winnings}** coins!",
-                    color=discord.Color.green()
-                )
+                embed.description = numbers + f"🎉 **CORRECT!**\nYou won **{winnings}** coins!"
+                embed.color = discord.Color.green()
                 
             else:
                 # User guessed wrong
-                await self.bot.data_manager.economy.remove_coins(user_id, amount, "pocket", f"High-Low loss ({amount} bet)")
+                delta, reason = -amount, f"High-Low loss ({amount} bet)"
                 
-                embed = discord.Embed(
-                    title="🔢 High or Low - Results", 
-                    description=f"First number: **{first_number}**\nSecond number: **{second_number}**\n\n💸 **WRONG!**\nYou lost **{amount}** coins!",
-                    color=discord.Color.red()
-                )
+                embed.description = numbers + f"💸 **WRONG!**\nYou lost **{amount}** coins!"
+                embed.color = discord.Color.red()
                 
-            await message.edit(embed=embed)
+            if not await self._settle_bet(user_id, amount, delta, reason, seed):
+                await view.finish(_SETTLE_FAILED_ERROR)
+                return
+                
+            await view.finish(embed)
             
         except asyncio.TimeoutError:
-            embed = create_error_embed("⏰ You took too long to guess! Game cancelled.")
-            await message.edit(embed=embed)
+            await message.edit(embed=_HL_TIMEOUT_ERROR, view=None)
 
     @commands.command(name="scratch")
     @commands.cooldown(1, 600, commands.BucketType.user)  # 10 minute cooldown
     async def scratch_command(self, ctx: commands.Context, amount: int = None):
         """Play a scratch card game"""
-        if amount is None:
-            embed = create_error_embed("You need to specify an amount to bet!\nUsage: `fg scratch <amount>`")
-            await ctx.send(embed=embed)
-            return
-            
-        if amount <= 0:
-            embed = create_error_embed("You need to bet a positive amount!")
-            await ctx.send(embed=embed)
+        pocket = await self._validate_bet(ctx, amount, "scratch")
+        if pocket is None:
             return
             
         user_id = ctx.author.id
-        pocket, _ = await self.bot.data_manager.get_balance(user_id)
-        
-        if amount > pocket:
-            embed = create_error_embed(f"You don't have {amount} coins in your pocket!")
-            await ctx.send(embed=embed)
-            return
+        seed, rng = _seed_game()
             
         # Generate scratch card with 9 symbols
-        symbols = ["💰", "💎", "🎰", "🍒", "🔔", "⭐", "💸"]
-        card = [random.choice(symbols) for _ in range(9)]
+        card = rng.choices(_SCRATCH_SYMBOLS, k=9)
         
         # Check for wins (3+ matching symbols)
-        symbol_counts = {}
-        for symbol in card:
-            symbol_counts[symbol] = symbol_counts.get(symbol, 0) + 1
-            
-        max_matches = max(symbol_counts.values())
-        winning_symbol = None
-        
-        for symbol, count in symbol_counts.items():
-            if count == max_matches and max_matches >= 3:
-                winning_symbol = symbol
-                break
-                
-        # Display the card
-        card_display = (
-            f"{card[0]} | {card[1]} | {card[2]}\n"
-            f"{card[3]} | {card[4]} | {card[5]}\n"
-            f"{card[6]} | {card[7]} | {card[8]}"
-        )
+        top_symbol, max_matches = Counter(card).most_common(1)[0]
+        winning_symbol = top_symbol if max_matches >= 3 else None
         
         embed = discord.Embed(title="🎫 Scratch Card", color=discord.Color.purple())
-        embed.add_field(name="Your Card", value=f"```{card_display}```", inline=False)
         
-        if winning_symbol and max_matches >= 3:
+        delta, reason = 0, None
+        
+        if winning_symbol:
             # Calculate winnings based on symbol and matches
-            multipliers = {
-                "💰": [0, 0, 0, 5, 20, 100],    # 3=5x, 4=20x, 5=100x
-                "💎": [0, 0, 0, 10, 50, 500],   # 3=10x, 4=50x, 5=500x
-                "🎰": [0, 0, 0, 3, 15, 75],     # 3=3x, 4=15x, 5=75x
-                "🍒": [0, 0, 0, 4, 18, 90],     # etc.
-                "🔔": [0, 0, 0, 6, 25, 125],
-                "⭐": [0, 0, 0, 8, 35, 175],
-                "💸": [0, 0, 0, 2, 10, 50],     # Lowest payout
-            }
-            
-            multiplier = multipliers.get(winning_symbol, [0, 0, 0, 2, 10, 50])[max_matches]
+            multiplier = _SCRATCH_MULT[_SCRATCH_INDEX[winning_symbol]][max_matches]
             winnings = amount * multiplier
             
-            await self.bot.data_manager.economy.add_coins(user_id, winnings, "pocket", f"Scratch card win ({amount} bet)")
+            delta, reason = winnings, f"Scratch card win ({amount} bet)"
             
-            embed.add_field(
-                name="Result", 
-                value=f"🎉 **{max_matches} {winning_symbol} MATCH!**\nYou won **{winnings}** coins!",
-                inline=False
-            )
+            result = f"🎉 **{max_matches} {winning_symbol} MATCH!**\nYou won **{winnings}** coins!"
             embed.color = discord.Color.gold()
             
         else:
             # No win
-            await self.bot.data_manager.economy.remove_coins(user_id, amount, "pocket", f"Scratch card loss ({amount} bet)")
+            delta, reason = -amount, f"Scratch card loss ({amount} bet)"
             
-            embed.add_field(name="Result", value=f"💸 **NO MATCH!**\nYou lost **{amount}** coins!", inline=False)
+            result = f"💸 **NO MATCH!**\nYou lost **{amount}** coins!"
             embed.color = discord.Color.red()
             
+        # Display the card and the result together
+        embed.description = _SCRATCH_TEMPLATE.format(*card) + "\n" + result
+        
+        if not await self._settle_bet(user_id, amount, delta, reason, seed):
+            await ctx.send(embed=_SETTLE_FAILED_ERROR)
+            return
+            
         await ctx.send(embed=embed)
 
     @commands.command(name="lottery")
     async def lottery_command(self, ctx: commands.Context, tickets: int = 1):
         """Buy lottery tickets for a chance to win big"""
         if tickets < 1 or tickets > 10:
-            embed = create_error_embed("You can buy 1-10 lottery tickets at a time!\nUsage: `fg lottery <1-10>`")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_LOTTERY_RANGE_ERROR)
             return
             
         user_id = ctx.author.id
@@ -464,15 +572,14 @@ class Gambling(commands.Cog):
             await ctx.send(embed=embed)
             return
             
-        # Deduct cost
-        await self.bot.data_manager.economy.remove_coins(user_id, total_cost, "pocket", f"Lottery tickets ({tickets})")
+        seed, rng = _seed_game()
         
         # Check each ticket
         winnings = 0
         results = []
         
         for i in range(tickets):
-            roll = random.randint(1, 1000)
+            roll = rng.randint(1, 1000)
             
             if roll <= 1:  # 0.1% chance
                 prize = 50000
@@ -493,20 +600,16 @@ class Gambling(commands.Cog):
             else:
                 results.append(f"Ticket {i+1}: 💸 No luck...")
                 
-        if winnings > 0:
-            await self.bot.data_manager.economy.add_coins(user_id, winnings, "pocket", f"Lottery winnings ({tickets} tickets)")
-            
         embed = discord.Embed(title="🎫 Lottery Results", color=discord.Color.gold() if winnings > 0 else discord.Color.red())
         
         embed.add_field(name="Tickets Bought", value=str(tickets), inline=True)
         embed.add_field(name="Total Cost", value=f"{total_cost} coins", inline=True)
         embed.add_field(name="Total Winnings", value=f"{winnings} coins", inline=True)
         
-        if len(results) <= 10:
-            embed.add_field(name="Results", value="\n".join(results), inline=False)
-        else:
-            embed.add_field(name="Results", value="\n".join(results[:10]) + f"\n...and {len(results)-10} more", inline=False)
-            
+        # tickets is capped at 10 above, so every result fits in the field
+        embed.add_field(name="Results", value="\n".join(results), inline=False)
+        
+        # Ticket cost and winnings settle as one net balance change
         net = winnings - total_cost
         if net > 0:
             embed.add_field(name="Net Result", value=f"💰 **Profit: {net} coins!**", inline=False)
@@ -515,6 +618,10 @@ class Gambling(commands.Cog):
         else:
             embed.add_field(name="Net Result", value="🤝 **Broke Even**", inline=False)
             
+        if not await self._settle_bet(user_id, total_cost, net, f"Lottery ({tickets} tickets)", seed):
+            await ctx.send(embed=_SETTLE_FAILED_ERROR)
+            return
+            
         await ctx.send(embed=embed)
 
     @commands.command(name="rps")
@@ -522,36 +629,23 @@ class Gambling(commands.Cog):
         """Play Rock Paper Scissors"""
         if user is None or user == ctx.author:
             # Play vs bot
-            choices = ["rock", "paper", "scissors"]
-            emojis = {"rock": "✊", "paper": "🖐️", "scissors": "✌️"}
-            
             embed = discord.Embed(
                 title="✊ Rock Paper Scissors",
                 description="Choose your move!",
                 color=discord.Color.blue()
             )
-            embed.set_footer(text="React with ✊ for Rock, 🖐️ for Paper, or ✌️ for Scissors")
-            
-            message = await ctx.send(embed=embed)
+            embed.set_footer(text="Press ✊ for Rock, 🖐️ for Paper, or ✌️ for Scissors")
             
-            for emoji in emojis.values():
-                await message.add_reaction(emoji)
-                
-            def check(reaction, user):
-                return (user == ctx.author and 
-                       str(reaction.emoji) in emojis.values() and 
-                       reaction.message == message)
+            view = RPSView(ctx.author)
+            message = await ctx.send(embed=embed, view=view)
             
             try:
-                reaction, _ = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
+                if await view.wait():
+                    raise asyncio.TimeoutError
+                    
+                user_choice = view.choice
                 
-                user_choice = None
-                for choice, emoji in emojis.items():
-                    if str(reaction.emoji) == emoji:
-                        user_choice = choice
-                        break
-                        
-                bot_choice = random.choice(choices)
+                bot_choice = _choice(_RPS_CHOICES)
                 
                 # Determine winner
                 if user_choice == bot_choice:
@@ -569,15 +663,14 @@ class Gambling(commands.Cog):
                     color = discord.Color.red()
                     
                 embed = discord.Embed(title="✊ Rock Paper Scissors - Results", color=color)
-                embed.add_field(name="Your Choice", value=f"{emojis[user_choice]} {user_choice.title()}", inline=True)
-                embed.add_field(name="Bot Choice", value=f"{emojis[bot_choice]} {bot_choice.title()}", inline=True)
+                embed.add_field(name="Your Choice", value=f"{_RPS_EMOJIS[user_choice]} {user_choice.title()}", inline=True)
+                embed.add_field(name="Bot Choice", value=f"{_RPS_EMOJIS[bot_choice]} {bot_choice.title()}", inline=True)
                 embed.add_field(name="Result", value=result, inline=False)
                 
-                await message.edit(embed=embed)
+                await view.finish(embed)
                 
             except asyncio.TimeoutError:
-                embed = create_error_embed("⏰ You took too long to choose! Game cancelled.")
-                await message.edit(embed=embed)
+                await message.edit(embed=_RPS_TIMEOUT_ERROR, view=None)
                 
         else:
             embed = create_info_embed("PvP Rock Paper Scissors coming soon! 🚀", title="Coming Soon")
@@ -589,8 +682,8 @@ class Gambling(commands.Cog):
         user_id = ctx.author.id
         
         # Simple snake simulation
-        moves = random.randint(5, 20)
-        score = moves * random.randint(10, 50)
+        moves = _randint(5, 20)
+        score = moves * _randint(10, 50)
         
         embed = create_success_embed(
             f"🐍 **Snake Game Complete!**\n"
@@ -601,7 +694,9 @@ class Gambling(commands.Cog):
         )
         
         coins_earned = score // 10
-        await self.bot.data_manager.economy.add_coins(user_id, coins_earned, "pocket", "Snake game")
+        await self.bot.data_manager.economy.apply_delta(
+            user_id, coins_earned, "pocket", transaction_type=TransactionType.EARN_MINIGAME, description="Snake game"
+        )
         
         await ctx.send(embed=embed)
 
@@ -611,15 +706,7 @@ class Gambling(commands.Cog):
         """Answer trivia questions for coins"""
         user_id = ctx.author.id
         
-        questions = [
-            {"q": "What is 2 + 2?", "answers": ["4", "four"], "reward": 100},
-            {"q": "What planet is closest to the Sun?", "answers": ["mercury"], "reward": 150},
-            {"q": "How many sides does a triangle have?", "answers": ["3", "three"], "reward": 100},
-            {"q": "What is the capital of France?", "answers": ["paris"], "reward": 200},
-            {"q": "What color do you get when you mix red and blue?", "answers": ["purple", "violet"], "reward": 150},
-        ]
-        
-        question = random.choice(questions)
+        question = _choice(_TRIVIA_QUESTIONS)
         
         embed = discord.Embed(
             title="🧠 Trivia Question",
@@ -630,14 +717,14 @@ class Gambling(commands.Cog):
         
         await ctx.send(embed=embed)
         
-        def check(m):
-            return m.author == ctx.author and m.channel == ctx.channel
-            
         try:
-            msg = await self.bot.wait_for("message", timeout=30.0, check=check)
+            msg = await self.bot.wait_for("message", timeout=30.0, check=_message_check(ctx.author, ctx.channel))
             
             if msg.content.lower().strip() in question["answers"]:
-                await self.bot.data_manager.economy.add_coins(user_id, question["reward"], "pocket", "Trivia correct")
+                await self.bot.data_manager.economy.apply_delta(
+                    user_id, question["reward"], "pocket",
+                    transaction_type=TransactionType.EARN_MINIGAME, description="Trivia correct"
+                )
                 
                 embed = create_success_embed(
                     f"✅ **Correct!**\nYou earned **{question['reward']}** coins!",
@@ -652,8 +739,7 @@ class Gambling(commands.Cog):
             await ctx.send(embed=embed)
             
         except asyncio.TimeoutError:
-            embed = create_error_embed("⏰ Time's up! You took too long to answer.")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_TRIVIA_TIMEOUT_ERROR)
 
 
 async def setup(bot):
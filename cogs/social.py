@@ -8,43 +8,183 @@ import random
 import asyncio
 from typing import Optional, List
 import logging
+from types import MappingProxyType
 
 from utils.embeds import create_success_embed, create_error_embed, create_info_embed
+from utils.views import PickView
 
 logger = logging.getLogger(__name__)
 
+# Adoptable pets and the names new pets are given
+_PET_TYPES = MappingProxyType({
+    "dog": MappingProxyType({"emoji": "🐕", "cost": 500, "happiness": 80}),
+    "cat": MappingProxyType({"emoji": "🐱", "cost": 400, "happiness": 70}),
+    "bird": MappingProxyType({"emoji": "🐦", "cost": 300, "happiness": 85}),
+    "fish": MappingProxyType({"emoji": "🐠", "cost": 200, "happiness": 60}),
+    "hamster": MappingProxyType({"emoji": "🐹", "cost": 250, "happiness": 75}),
+    "rabbit": MappingProxyType({"emoji": "🐰", "cost": 350, "happiness": 90}),
+})
+_PET_TYPES_STR = ", ".join(_PET_TYPES)
+_PET_NAMES = ("Buddy", "Luna", "Max", "Bella", "Charlie", "Lucy", "Rocky", "Molly", "Jack", "Daisy")
+
+# Error embeds for fixed messages are built once and re-sent
+_MARRY_USAGE_ERROR = create_error_embed(
+    "You need to specify someone to marry!\nUsage: `fg marry @user`", timestamp=False
+)
+_MARRY_SELF_ERROR = create_error_embed("You can't marry yourself! 💔", timestamp=False)
+_MARRY_BOT_ERROR = create_error_embed("You can't marry bots! They don't have feelings... 🤖💔", timestamp=False)
+_ALREADY_MARRIED_ERROR = create_error_embed(
+    "You're already married! Divorce first if you want to remarry.", timestamp=False
+)
+_PROPOSAL_TIMEOUT_ERROR = create_error_embed(
+    "⏰ The proposal timed out! No response from the proposed user.", timestamp=False
+)
+_NOT_MARRIED_ERROR = create_error_embed("You're not married! Use `fg marry @user` to find love.", timestamp=False)
+_DIVORCE_TIMEOUT_ERROR = create_error_embed("⏰ Divorce confirmation timed out.", timestamp=False)
+_PET_TYPE_MISSING_ERROR = create_error_embed(
+    f"Specify a pet type to adopt!\nAvailable: {_PET_TYPES_STR}", timestamp=False
+)
+_PET_TYPE_INVALID_ERROR = create_error_embed("Invalid pet type! Available: " + _PET_TYPES_STR, timestamp=False)
+_PET_ACTION_ERROR = create_error_embed("Valid pet actions: adopt, list, feed, play, rename", timestamp=False)
+_FRIEND_TARGET_ERROR = create_error_embed("You need to specify a valid user to add as friend!", timestamp=False)
+_FRIEND_ACTION_ERROR = create_error_embed("Valid friend actions: add, remove, list, requests", timestamp=False)
+_COMPARE_USAGE_ERROR = create_error_embed(
+    "You need to specify another user to compare with!\nUsage: `fg compare @user`", timestamp=False
+)
+_GIFT_USAGE_ERROR = create_error_embed("Usage: `fg gift @user <amount>`", timestamp=False)
+_GIFT_SELF_ERROR = create_error_embed("You can't gift coins to yourself!", timestamp=False)
+_GIFT_BOT_ERROR = create_error_embed("You can't gift coins to bots!", timestamp=False)
+_GIFT_POSITIVE_ERROR = create_error_embed("Gift amount must be positive!", timestamp=False)
+_GIFT_MINIMUM_ERROR = create_error_embed("Minimum gift amount is 10 coins!", timestamp=False)
+_GIFT_FAILED_ERROR = create_error_embed("The gift couldn't be completed. No coins were moved.", timestamp=False)
+
+# Static menus kept as embed payloads; Embed.from_dict takes them as-is
+_PET_HELP_TEXT = "\n".join((
+    "`fg pet adopt <type>` - Adopt a new pet",
+    "`fg pet list` - View your pets",
+    "`fg pet feed <name>` - Feed your pet",
+    "`fg pet play <name>` - Play with your pet",
+    "`fg pet rename <old> <new>` - Rename your pet",
+))
+_PET_HELP_PAYLOAD = {
+    "title": "🐾 Pet Commands",
+    "description": "Manage your virtual pets!",
+    "color": discord.Color.blue().value,
+    "fields": [
+        {"name": "Commands", "value": _PET_HELP_TEXT, "inline": False},
+        {"name": "Available Pet Types", "value": _PET_TYPES_STR, "inline": False},
+    ],
+}
+
+_FRIENDS_HELP_TEXT = "\n".join((
+    "`fg friends add @user` - Send friend request",
+    "`fg friends remove @user` - Remove friend",
+    "`fg friends list` - View friends list",
+    "`fg friends requests` - View pending requests",
+))
+_FRIENDS_HELP_PAYLOAD = {
+    "title": "👥 Friends System",
+    "description": "Manage your friends list!",
+    "color": discord.Color.green().value,
+    "fields": [{"name": "Commands", "value": _FRIENDS_HELP_TEXT, "inline": False}],
+}
+
+# Sample achievements: (name, description, progress, reward)
+_SAMPLE_ACHIEVEMENTS = (
+    ("First Steps", "Use your first command", "✅ Complete", "100 coins"),
+    ("Big Spender", "Spend 10,000 coins", "⏳ 5,240/10,000", "Spender badge"),
+    ("Gambler", "Win 100 gambling games", "⏳ 23/100", "Lucky charm"),
+    ("Social Butterfly", "Make 10 friends", "⏳ 2/10", "Friend badge"),
+    ("Workaholic", "Work 50 times", "⏳ 12/50", "Work multiplier"),
+)
+# Per-user title is added at send time
+_ACHIEVEMENTS_PAYLOAD = {
+    "description": "Track your progress and unlock rewards!",
+    "color": discord.Color.gold().value,
+    "fields": [
+        {"name": f"{name} - {reward}", "value": f"{desc}\n{progress}", "inline": False}
+        for name, desc, progress, reward in _SAMPLE_ACHIEVEMENTS
+    ],
+    "footer": {"text": "Achievement system coming soon! 🚧"},
+}
+
+_BADGES_TEXT = "\n".join((
+    "🆕 Newcomer - Join the server",
+    "💰 Rich - Have 100,000+ coins",
+    "🎰 Lucky - Win a gambling jackpot",
+    "💕 Married - Get married",
+    "🐕 Pet Owner - Adopt a pet",
+    "👑 Premium - Support the bot",
+))
+# Per-user title is added at send time
+_BADGES_PAYLOAD = {
+    "description": "Collect badges by completing achievements!",
+    "color": discord.Color.purple().value,
+    "fields": [{"name": "Available Badges", "value": _BADGES_TEXT, "inline": False}],
+    "footer": {"text": "Badge system coming soon! 🚧"},
+}
+
+
+class ProposalView(PickView):
+    """Accept/reject buttons for the proposed user"""
+    
+    @discord.ui.button(label="Accept", emoji="💍", style=discord.ButtonStyle.success)
+    async def accept(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._pick(interaction, "accept")
+        
+    @discord.ui.button(label="Reject", emoji="💔", style=discord.ButtonStyle.danger)
+    async def reject(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._pick(interaction, "reject")
+
+
+class DivorceView(PickView):
+    """Confirm/cancel buttons for a divorce"""
+    
+    @discord.ui.button(label="Confirm", emoji="✅", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._pick(interaction, "confirm")
+        
+    @discord.ui.button(label="Cancel", emoji="❌", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._pick(interaction, "cancel")
+
 
 class Social(commands.Cog):
     """Social features and interactions"""
     
     def __init__(self, bot):
         self.bot = bot
+        
+        # Static help menus are built once and re-sent
+        self._pet_help_embed = discord.Embed.from_dict(_PET_HELP_PAYLOAD)
+        self._friends_help_embed = discord.Embed.from_dict(_FRIENDS_HELP_PAYLOAD)
+        
+        # Strong references to fire-and-forget tasks so they aren't collected mid-flight
+        self._background_tasks = set()
 
     @commands.command(name="marry", aliases=["propose"])
     async def marry_command(self, ctx: commands.Context, user: discord.Member = None):
         """Marry another user"""
         if user is None:
-            embed = create_error_embed("You need to specify someone to marry!\nUsage: `fg marry @user`")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_MARRY_USAGE_ERROR)
             return
             
         if user.id == ctx.author.id:
-            embed = create_error_embed("You can't marry yourself! 💔")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_MARRY_SELF_ERROR)
             return
             
         if user.bot:
-            embed = create_error_embed("You can't marry bots! They don't have feelings... 🤖💔")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_MARRY_BOT_ERROR)
             return
             
-        # Check if either user is already married
-        author_married = await self.bot.data_manager.is_married(ctx.author.id)
-        target_married = await self.bot.data_manager.is_married(user.id)
+        # Check if either user is already married (both lookups run concurrently)
+        author_married, target_married = await asyncio.gather(
+            self.bot.data_manager.is_married(ctx.author.id),
+            self.bot.data_manager.is_married(user.id)
+        )
         
         if author_married:
-            embed = create_error_embed("You're already married! Divorce first if you want to remarry.")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_ALREADY_MARRIED_ERROR)
             return
             
         if target_married:
@@ -52,49 +192,60 @@ class Social(commands.Cog):
             await ctx.send(embed=embed)
             return
             
+        # Record the pending proposal; this also checks the proposer can cover the marriage cost
+        marriage = self.bot.data_manager.marriage
+        success, message = await marriage.send_proposal(ctx.author.id, user.id)
+        if not success:
+            await ctx.send(embed=create_error_embed(message))
+            return
+            
         # Send proposal
         embed = discord.Embed(
             title="💍 Marriage Proposal",
             description=f"{ctx.author.mention} is proposing to {user.mention}!\n\n💕 Will you marry them? 💕",
             color=discord.Color.pink()
         )
-        embed.set_footer(text="React with 💍 to accept or 💔 to reject")
-        
-        message = await ctx.send(embed=embed)
-        await message.add_reaction("💍")
-        await message.add_reaction("💔")
+        embed.set_footer(text="Press 💍 to accept or 💔 to reject")
         
-        def check(reaction, react_user):
-            return (react_user == user and 
-                   str(reaction.emoji) in ["💍", "💔"] and 
-                   reaction.message == message)
+        # Only the proposed user can answer
+        view = ProposalView(user, timeout=60.0)
+        prompt = await ctx.send(embed=embed, view=view)
         
-        try:
-            reaction, _ = await self.bot.wait_for("reaction_add", timeout=60.0, check=check)
+        if await view.wait():
+            await marriage.reject_proposal(user.id, ctx.author.id)
+            await prompt.edit(embed=_PROPOSAL_TIMEOUT_ERROR, view=None)
+            return
             
-            if str(reaction.emoji) == "💍":
-                # Accept proposal
-                await self.bot.data_manager.marriage.create_marriage(ctx.author.id, user.id)
-                
-                embed = create_success_embed(
-                    f"🎉 **Congratulations!** 🎉\n"
-                    f"{ctx.author.mention} and {user.mention} are now married!\n"
-                    f"💕 You both get a 10% bonus on all earnings! 💕",
-                    title="Marriage Complete"
-                )
-                await message.edit(embed=embed)
+        # The click is already deferred, so always answer it even if storage fails
+        try:
+            if view.choice == "accept":
+                success, message = await marriage.accept_proposal(user.id, ctx.author.id)
                 
+                if success:
+                    embed = create_success_embed(
+                        f"🎉 **Congratulations!** 🎉\n"
+                        f"{ctx.author.mention} and {user.mention} are now married!\n"
+                        f"💕 You both get a 10% bonus on all earnings! 💕",
+                        title="Marriage Complete"
+                    )
+                else:
+                    # Don't leave the failed proposal pending, or it blocks proposing again
+                    await marriage.reject_proposal(user.id, ctx.author.id)
+                    embed = create_error_embed(message, title="Marriage Failed")
+                    
             else:
                 # Reject proposal
+                await marriage.reject_proposal(user.id, ctx.author.id)
                 embed = create_error_embed(
                     f"💔 **Proposal Rejected!**\n{user.mention} said no... Better luck next time!",
                     title="Marriage Rejected"
                 )
-                await message.edit(embed=embed)
                 
-        except asyncio.TimeoutError:
-            embed = create_error_embed("⏰ The proposal timed out! No response from the proposed user.")
-            await message.edit(embed=embed)
+        except Exception as e:
+            logger.error(f"Error answering marriage proposal: {e}")
+            embed = create_error_embed("Something went wrong with the proposal. Please try again later.")
+            
+        await view.finish(embed)
 
     @commands.command(name="divorce")
     async def divorce_command(self, ctx: commands.Context):
@@ -103,99 +254,64 @@ class Social(commands.Cog):
         
         married = await self.bot.data_manager.is_married(user_id)
         if not married:
-            embed = create_error_embed("You're not married! Use `fg marry @user` to find love.")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_NOT_MARRIED_ERROR)
             return
             
-        # Get spouse info
-        marriage_data = await self.bot.data_manager.marriage.get_marriage(user_id)
-        spouse_id = marriage_data.get('spouse_id')
-        
         # Confirm divorce
         embed = discord.Embed(
             title="💔 Divorce Confirmation",
             description="Are you sure you want to divorce? This action cannot be undone!\n\nYou'll lose your marriage bonus.",
             color=discord.Color.red()
         )
-        embed.set_footer(text="React with ✅ to confirm or ❌ to cancel")
-        
-        message = await ctx.send(embed=embed)
-        await message.add_reaction("✅")
-        await message.add_reaction("❌")
+        embed.set_footer(text="Press ✅ to confirm or ❌ to cancel")
         
-        def check(reaction, user):
-            return (user == ctx.author and 
-                   str(reaction.emoji) in ["✅", "❌"] and 
-                   reaction.message == message)
+        view = DivorceView(ctx.author, timeout=30.0)
+        prompt = await ctx.send(embed=embed, view=view)
         
-        try:
-            reaction, _ = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
+        if await view.wait():
+            await prompt.edit(embed=_DIVORCE_TIMEOUT_ERROR, view=None)
+            return
             
-            if str(reaction.emoji) == "✅":
-                await self.bot.data_manager.marriage.end_marriage(user_id)
+        # The click is already deferred, so always answer it even if storage fails
+        if view.choice == "confirm":
+            try:
+                success, message = await self.bot.data_manager.marriage.divorce(user_id)
+            except Exception as e:
+                logger.error(f"Error processing divorce for user {user_id}: {e}")
+                success, message = False, "Something went wrong with the divorce. Please try again later."
                 
+            if success:
                 embed = create_success_embed(
                     "💔 **Divorce Complete**\nYou are now single again. Your marriage bonus has been removed.",
                     title="Divorce Finalized"
                 )
             else:
-                embed = create_info_embed("❌ **Divorce Cancelled**\nYour marriage remains intact!", title="Cancelled")
-                
-            await message.edit(embed=embed)
+                embed = create_error_embed(message, title="Divorce Failed")
+        else:
+            embed = create_info_embed("❌ **Divorce Cancelled**\nYour marriage remains intact!", title="Cancelled")
             
-        except asyncio.TimeoutError:
-            embed = create_error_embed("⏰ Divorce confirmation timed out.")
-            await message.edit(embed=embed)
+        await view.finish(embed)
 
     @commands.command(name="pet")
     async def pet_command(self, ctx: commands.Context, action: str = None, *, target: str = None):
         """Manage your virtual pets"""
         if action is None:
-            embed = discord.Embed(
-                title="🐾 Pet Commands",
-                description="Manage your virtual pets!",
-                color=discord.Color.blue()
-            )
-            
-            commands_list = [
-                "`fg pet adopt <type>` - Adopt a new pet",
-                "`fg pet list` - View your pets",
-                "`fg pet feed <name>` - Feed your pet",
-                "`fg pet play <name>` - Play with your pet",
-                "`fg pet rename <old> <new>` - Rename your pet"
-            ]
-            
-            embed.add_field(name="Commands", value="\\n".join(commands_list), inline=False)
-            embed.add_field(
-                name="Available Pet Types",
-                value="dog, cat, bird, fish, hamster, rabbit",
-                inline=False
-            )
-            
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._pet_help_embed)
             return
             
-        if action.lower() == "adopt":
+        action = action.lower()
+        
+        if action == "adopt":
             if target is None:
-                embed = create_error_embed("Specify a pet type to adopt!\nAvailable: dog, cat, bird, fish, hamster, rabbit")
-                await ctx.send(embed=embed)
+                await ctx.send(embed=_PET_TYPE_MISSING_ERROR)
                 return
                 
-            pet_types = {
-                "dog": {"emoji": "🐕", "cost": 500, "happiness": 80},
-                "cat": {"emoji": "🐱", "cost": 400, "happiness": 70},
-                "bird": {"emoji": "🐦", "cost": 300, "happiness": 85},
-                "fish": {"emoji": "🐠", "cost": 200, "happiness": 60},
-                "hamster": {"emoji": "🐹", "cost": 250, "happiness": 75},
-                "rabbit": {"emoji": "🐰", "cost": 350, "happiness": 90}
-            }
-            
-            if target.lower() not in pet_types:
-                embed = create_error_embed("Invalid pet type! Available: " + ", ".join(pet_types.keys()))
-                await ctx.send(embed=embed)
+            target = target.lower()
+            if target not in _PET_TYPES:
+                await ctx.send(embed=_PET_TYPE_INVALID_ERROR)
                 return
                 
-            pet_info = pet_types[target.lower()]
+            pet_info = _PET_TYPES[target]
             user_id = ctx.author.id
             
             # Check if user can afford
@@ -209,67 +325,51 @@ class Social(commands.Cog):
             await self.bot.data_manager.economy.remove_coins(user_id, pet_info["cost"], "pocket", f"Pet adoption ({target})")
             
             # Generate random pet name
-            names = ["Buddy", "Luna", "Max", "Bella", "Charlie", "Lucy", "Rocky", "Molly", "Jack", "Daisy"]
-            pet_name = random.choice(names)
+            pet_name = random.choice(_PET_NAMES)
             
             embed = create_success_embed(
-                f"{pet_info['emoji']} **Pet Adopted!**\\n"
-                f"You adopted a {target} named **{pet_name}**!\\n"
-                f"Cost: {pet_info['cost']} coins\\n\\n"
+                f"{pet_info['emoji']} **Pet Adopted!**\n"
+                f"You adopted a {target} named **{pet_name}**!\n"
+                f"Cost: {pet_info['cost']} coins\n\n"
                 f"Use `fg pet feed {pet_name}` and `fg pet play {pet_name}` to keep them happy!",
                 title="New Pet"
             )
             await ctx.send(embed=embed)
             
-        elif action.lower() == "list":
+        elif action == "list":
             embed = create_info_embed("Your pet collection is coming soon! 🚧", title="Pet List")
             await ctx.send(embed=embed)
             
         else:
-            embed = create_error_embed("Valid pet actions: adopt, list, feed, play, rename")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_PET_ACTION_ERROR)
 
     @commands.command(name="friends")
     async def friends_command(self, ctx: commands.Context, action: str = None, user: discord.Member = None):
         """Manage your friends list"""
         if action is None:
-            embed = discord.Embed(
-                title="👥 Friends System",
-                description="Manage your friends list!",
-                color=discord.Color.green()
-            )
-            
-            commands_list = [
-                "`fg friends add @user` - Send friend request",
-                "`fg friends remove @user` - Remove friend",
-                "`fg friends list` - View friends list",
-                "`fg friends requests` - View pending requests"
-            ]
-            
-            embed.add_field(name="Commands", value="\\n".join(commands_list), inline=False)
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._friends_help_embed)
             return
             
-        if action.lower() == "add":
+        action = action.lower()
+        
+        if action == "add":
             if user is None or user == ctx.author:
-                embed = create_error_embed("You need to specify a valid user to add as friend!")
-                await ctx.send(embed=embed)
+                await ctx.send(embed=_FRIEND_TARGET_ERROR)
                 return
                 
             embed = create_success_embed(
-                f"Friend request sent to {user.mention}! 👥\\n"
+                f"Friend request sent to {user.mention}! 👥\n"
                 f"They can accept with `fg friends accept @{ctx.author.name}`",
                 title="Friend Request Sent"
             )
             await ctx.send(embed=embed)
             
-        elif action.lower() == "list":
+        elif action == "list":
             embed = create_info_embed("Your friends list is coming soon! 👥🚧", title="Friends List")
             await ctx.send(embed=embed)
             
         else:
-            embed = create_error_embed("Valid friend actions: add, remove, list, requests")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_FRIEND_ACTION_ERROR)
 
     @commands.command(name="achievements", aliases=["ach"])
     async def achievements_command(self, ctx: commands.Context, user: discord.Member = None):
@@ -277,29 +377,7 @@ class Social(commands.Cog):
         if user is None:
             user = ctx.author
             
-        embed = discord.Embed(
-            title=f"🏆 {user.display_name}'s Achievements",
-            description="Track your progress and unlock rewards!",
-            color=discord.Color.gold()
-        )
-        
-        # Sample achievements
-        achievements = [
-            {"name": "First Steps", "desc": "Use your first command", "progress": "✅ Complete", "reward": "100 coins"},
-            {"name": "Big Spender", "desc": "Spend 10,000 coins", "progress": "⏳ 5,240/10,000", "reward": "Spender badge"},
-            {"name": "Gambler", "desc": "Win 100 gambling games", "progress": "⏳ 23/100", "reward": "Lucky charm"},
-            {"name": "Social Butterfly", "desc": "Make 10 friends", "progress": "⏳ 2/10", "reward": "Friend badge"},
-            {"name": "Workaholic", "desc": "Work 50 times", "progress": "⏳ 12/50", "reward": "Work multiplier"},
-        ]
-        
-        for ach in achievements:
-            embed.add_field(
-                name=f"{ach['name']} - {ach['reward']}",
-                value=f"{ach['desc']}\\n{ach['progress']}",
-                inline=False
-            )
-            
-        embed.set_footer(text="Achievement system coming soon! 🚧")
+        embed = discord.Embed.from_dict({**_ACHIEVEMENTS_PAYLOAD, "title": f"🏆 {user.display_name}'s Achievements"})
         await ctx.send(embed=embed)
 
     @commands.command(name="badges")
@@ -308,42 +386,21 @@ class Social(commands.Cog):
         if user is None:
             user = ctx.author
             
-        embed = discord.Embed(
-            title=f"🎖️ {user.display_name}'s Badges",
-            description="Collect badges by completing achievements!",
-            color=discord.Color.purple()
-        )
-        
-        # Sample badges
-        badges = [
-            "🆕 Newcomer - Join the server",
-            "💰 Rich - Have 100,000+ coins",
-            "🎰 Lucky - Win a gambling jackpot",
-            "💕 Married - Get married",
-            "🐕 Pet Owner - Adopt a pet",
-            "👑 Premium - Support the bot"
-        ]
-        
-        embed.add_field(
-            name="Available Badges",
-            value="\\n".join(badges),
-            inline=False
-        )
-        
-        embed.set_footer(text="Badge system coming soon! 🚧")
+        embed = discord.Embed.from_dict({**_BADGES_PAYLOAD, "title": f"🎖️ {user.display_name}'s Badges"})
         await ctx.send(embed=embed)
 
     @commands.command(name="compare")
     async def compare_command(self, ctx: commands.Context, user: discord.Member = None):
         """Compare your stats with another user"""
         if user is None or user == ctx.author:
-            embed = create_error_embed("You need to specify another user to compare with!\nUsage: `fg compare @user`")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_COMPARE_USAGE_ERROR)
             return
             
         # Get both users' data
-        author_pocket, author_bank = await self.bot.data_manager.get_balance(ctx.author.id)
-        user_pocket, user_bank = await self.bot.data_manager.get_balance(user.id)
+        (author_pocket, author_bank), (user_pocket, user_bank) = await asyncio.gather(
+            self.bot.data_manager.get_balance(ctx.author.id),
+            self.bot.data_manager.get_balance(user.id)
+        )
         
         author_total = author_pocket + author_bank
         user_total = user_pocket + user_bank
@@ -355,7 +412,7 @@ class Social(commands.Cog):
         
         embed.add_field(
             name=f"💰 {ctx.author.display_name}",
-            value=f"Pocket: {author_pocket:,}\\nBank: {author_bank:,}\\n**Total: {author_total:,}**",
+            value=f"Pocket: {author_pocket:,}\nBank: {author_bank:,}\n**Total: {author_total:,}**",
             inline=True
         )
         
@@ -367,7 +424,7 @@ class Social(commands.Cog):
         
         embed.add_field(
             name=f"💰 {user.display_name}",
-            value=f"Pocket: {user_pocket:,}\\nBank: {user_bank:,}\\n**Total: {user_total:,}**",
+            value=f"Pocket: {user_pocket:,}\nBank: {user_bank:,}\n**Total: {user_total:,}**",
             inline=True
         )
         
@@ -384,7 +441,7 @@ class Social(commands.Cog):
             
         embed.add_field(
             name="Result",
-            value=f"{winner}\\n{f'Difference: {difference:,} coins' if difference > 0 else ''}",
+            value=f"{winner}\n{f'Difference: {difference:,} coins' if difference > 0 else ''}",
             inline=False
         )
         
@@ -395,28 +452,23 @@ class Social(commands.Cog):
     async def gift_command(self, ctx: commands.Context, user: discord.Member = None, amount: int = None):
         """Gift coins to another user"""
         if user is None or amount is None:
-            embed = create_error_embed("Usage: `fg gift @user <amount>`")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_GIFT_USAGE_ERROR)
             return
             
         if user.id == ctx.author.id:
-            embed = create_error_embed("You can't gift coins to yourself!")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_GIFT_SELF_ERROR)
             return
             
         if user.bot:
-            embed = create_error_embed("You can't gift coins to bots!")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_GIFT_BOT_ERROR)
             return
             
         if amount <= 0:
-            embed = create_error_embed("Gift amount must be positive!")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_GIFT_POSITIVE_ERROR)
             return
             
         if amount < 10:
-            embed = create_error_embed("Minimum gift amount is 10 coins!")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_GIFT_MINIMUM_ERROR)
             return
             
         user_id = ctx.author.id
@@ -427,27 +479,34 @@ class Social(commands.Cog):
             await ctx.send(embed=embed)
             return
             
-        # Transfer coins
-        await self.bot.data_manager.economy.remove_coins(user_id, amount, "pocket", f"Gift to {user.name}")
-        await self.bot.data_manager.economy.add_coins(user.id, amount, "pocket", f"Gift from {ctx.author.name}")
-        
+        # Transfer coins (debit and credit are applied together)
+        if not await self.bot.data_manager.economy.transfer_money(user_id, user.id, amount):
+            await ctx.send(embed=_GIFT_FAILED_ERROR)
+            return
+            
         embed = create_success_embed(
-            f"🎁 **Gift Sent!**\\n"
-            f"You gave **{amount}** coins to {user.mention}!\\n"
+            f"🎁 **Gift Sent!**\n"
+            f"You gave **{amount}** coins to {user.mention}!\n"
             f"Spreading the wealth! 💖",
             title="Gift Complete"
         )
         
         await ctx.send(embed=embed)
         
-        # Try to notify the recipient
+        # Notify the recipient in the background; the sender doesn't wait on the DM
+        dm_embed = create_info_embed(
+            f"🎁 You received **{amount}** coins from {ctx.author.mention} in {ctx.guild.name}!",
+            title="Gift Received"
+        )
+        task = asyncio.create_task(self._safe_dm(user, dm_embed))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        
+    async def _safe_dm(self, user: discord.abc.User, embed: discord.Embed):
+        """DM a user, ignoring failures such as disabled DMs"""
         try:
-            dm_embed = create_info_embed(
-                f"🎁 You received **{amount}** coins from {ctx.author.mention} in {ctx.guild.name}!",
-                title="Gift Received"
-            )
-            await user.send(embed=dm_embed)
-        except:
+            await user.send(embed=embed)
+        except discord.HTTPException:
             pass  # User has DMs disabled
 
 
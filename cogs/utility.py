@@ -5,138 +5,311 @@ Contains utility commands like help, leaderboard, settings, etc.
 import discord
 from discord.ext import commands
 import logging
-from typing import Optional, List
-import math
+import time
+from types import MappingProxyType
 
 from utils.embeds import create_success_embed, create_error_embed, create_info_embed
 
 logger = logging.getLogger(__name__)
 
+# Every accepted spelling mapped to its canonical category
+_HELP_ALIASES = MappingProxyType({
+    "economy": "economy", "eco": "economy", "money": "economy",
+    "gambling": "gambling", "gamble": "gambling", "games": "gambling",
+    "fun": "fun", "meme": "fun", "jokes": "fun",
+    "social": "social", "marriage": "social", "pets": "social",
+    "utility": "utility", "util": "utility", "settings": "utility",
+})
+_LB_ALIASES = MappingProxyType({
+    "money": "money", "coins": "money", "bal": "money", "balance": "money",
+    "level": "level", "levels": "level", "xp": "level", "exp": "level",
+})
 
+# Commands listed by `fg cooldowns`, and its embed color
+_COOLDOWN_COMMANDS = (
+    "beg", "work", "crime", "rob", "daily", "weekly", "monthly",
+    "gamble", "slots", "blackjack", "highlow", "scratch",
+)
+_COOLDOWN_COMMAND_NAMES = frozenset(_COOLDOWN_COMMANDS)
+_LONGEST_COOLDOWN = 30 * 24 * 3600  # monthly
+_LAST_USED_PRUNE_INTERVAL = 3600  # how often on_command drops last-used times past the longest cooldown
+_COOLDOWNS_COLOR = discord.Color.orange()
+
+# Fixed-text replies are built once and re-sent
+_PREFIX_LENGTH_ERROR = create_error_embed("Prefix cannot be longer than 5 characters!", timestamp=False)
+_PREFIX_UNSUPPORTED_INFO = create_info_embed(
+    "Prefix change is not implemented yet! 🚧\nThe bot will always use `fg ` as the prefix for now.",
+    title="Prefix Change",
+    timestamp=False
+)
+
+# (field name, summary) rows for the main help menu
+_HELP_CATEGORIES = (
+    ("💰 Economy", "economy - Work, beg, crime, rob, bank, shop, inventory"),
+    ("🎲 Gambling", "gambling - Blackjack, slots, gamble, highlow, scratch"),
+    ("😄 Fun", "fun - 8ball, joke, roast, hack, ship, rate, emojify"),
+    ("👥 Social", "social - Marriage, pets, friends, profile (coming soon)"),
+    ("🛠️ Utility", "utility - Help, leaderboard, settings"),
+    ("ℹ️ Core", "core - Ping, info, balance, daily, profile"),
+)
+
+# Category help bodies, joined once at import
+_ECONOMY_HELP_TEXT = "\n".join((
+    "`fg beg` - Beg for coins (30s cooldown)",
+    "`fg work` - Work at a job (1h cooldown)",
+    "`fg crime` - Commit crimes for money (2h cooldown)",
+    "`fg rob @user` - Rob another user (1h cooldown)",
+    "`fg daily` - Claim daily bonus (24h cooldown)",
+    "`fg weekly` - Claim weekly bonus (7d cooldown)",
+    "`fg monthly` - Claim monthly bonus (30d cooldown)",
+    "`fg deposit <amount>` - Put coins in bank",
+    "`fg withdraw <amount>` - Take coins from bank",
+    "`fg shop` - View the item shop",
+    "`fg inventory` - View your items",
+    "`fg balance` - Check your money",
+))
+_GAMBLING_HELP_TEXT = "\n".join((
+    "`fg gamble <amount>` - Roll dice vs bot",
+    "`fg slots <amount>` - Play slot machine",
+    "`fg blackjack <amount>` - Play blackjack",
+    "`fg highlow <amount>` - Guess higher/lower",
+    "`fg scratch <amount>` - Scratch card game",
+))
+_FUN_HELP_TEXT = "\n".join((
+    "`fg 8ball <question>` - Ask magic 8-ball",
+    "`fg joke` - Get a random joke",
+    "`fg roast @user` - Roast someone",
+    "`fg hack @user` - Fake hack someone",
+    "`fg ship @user1 @user2` - Ship calculator",
+    "`fg rate <thing>` - Rate something out of 10",
+    "`fg kill @user` - Fake kill someone",
+    "`fg emojify <text>` - Convert text to emojis",
+    "`fg clap <text>` - Add clap emojis",
+    "`fg fortune` - Get fortune cookie",
+    "`fg fact` - Random fun fact",
+))
+_UTILITY_HELP_TEXT = "\n".join((
+    "`fg help [category]` - Show this help menu",
+    "`fg leaderboard` - View money leaderboard",
+    "`fg ping` - Check bot latency",
+    "`fg info` - Bot information",
+))
+
+# Placeholder pages that never change; Embed.from_dict takes them as-is
+# TODO: Implement actual leaderboards from database
+_LEADERBOARD_PAYLOADS = MappingProxyType({
+    "money": {
+        "title": "💰 Money Leaderboard",
+        "description": "Top richest users (coming soon!)",
+        "color": discord.Color.gold().value,
+        "fields": [{
+            "name": "🏆 Top Users",
+            "value": "Leaderboard system coming soon! 🚧\nYour stats are being tracked!",
+            "inline": False,
+        }],
+    },
+    "level": {
+        "title": "⭐ Level Leaderboard",
+        "description": "Top users by level (coming soon!)",
+        "color": discord.Color.blue().value,
+        "fields": [{"name": "🏆 Top Users", "value": "Level leaderboard coming soon! 🚧", "inline": False}],
+    },
+})
+
+# TODO: Get actual stats from database; per-user title is added at send time
+_STATS_PAYLOAD = {
+    "color": discord.Color.blue().value,
+    "fields": [
+        {"name": name, "value": "Coming soon! 🚧", "inline": True}
+        for name in ("Commands Used", "Money Earned", "Gambling Wins", "Items Owned", "Achievement Points", "Level")
+    ],
+    "footer": {"text": "Detailed statistics system coming soon!"},
+}
+
+_SUPPORT_PAYLOAD = {
+    "title": "🆘 Support & Information",
+    "description": "Need help with FunniGuy Bot?",
+    "color": discord.Color.blue().value,
+    "fields": [
+        {"name": "📚 Commands", "value": "Use `fg help` to see all commands!", "inline": False},
+        {
+            "name": "🐛 Found a Bug?",
+            "value": "This bot is a Dank Memer clone created by AI!\nReport issues to your bot admin.",
+            "inline": False,
+        },
+        {"name": "💡 Suggestions", "value": "Have ideas for new features? Let us know!", "inline": False},
+    ],
+}
+
+
+def _build_help_embeds():
+    """Build the main help menu and each category page, keyed by canonical category"""
+    embeds = {}
+    
+    # Main help menu
+    embed = discord.Embed(
+        title="🤖 FunniGuy Bot - Command Help",
+        description="A complete Dank Memer clone with 80+ commands!\nUse `fg help <category>` for detailed commands.",
+        color=discord.Color.blue()
+    )
+    
+    for category_name, description in _HELP_CATEGORIES:
+        embed.add_field(name=category_name, value=description, inline=False)
+        
+    embed.set_footer(text="Example: fg help economy")
+    
+    main_embed = embed
+    
+    embed = discord.Embed(
+        title="💰 Economy Commands",
+        description="Make money and manage your finances!\n\n" + _ECONOMY_HELP_TEXT,
+        color=discord.Color.gold()
+    )
+    
+    embeds["economy"] = embed
+    
+    embed = discord.Embed(
+        title="🎲 Gambling Commands",
+        description="Risk it all for big rewards!\n\n" + _GAMBLING_HELP_TEXT,
+        color=discord.Color.red()
+    )
+    
+    embeds["gambling"] = embed
+    
+    embed = discord.Embed(
+        title="😄 Fun Commands",
+        description="Entertainment and meme commands!\n\n" + _FUN_HELP_TEXT,
+        color=discord.Color.purple()
+    )
+    
+    embeds["fun"] = embed
+    
+    embed = discord.Embed(
+        title="👥 Social Commands",
+        description="Social features (coming soon!)",
+        color=discord.Color.pink()
+    )
+    
+    embed.add_field(name="Coming Soon", value="Marriage, pets, friends, trading, and more!", inline=False)
+    
+    embeds["social"] = embed
+    
+    embed = discord.Embed(
+        title="🛠️ Utility Commands",
+        description="Helpful utility commands!\n\n" + _UTILITY_HELP_TEXT,
+        color=discord.Color.green()
+    )
+    
+    embeds["utility"] = embed
+    
+    return main_embed, embeds
+
+
+def _build_cooldowns_embed(ready_commands, cooldown_commands_list):
+    """Build the `fg cooldowns` embed from formatted ready and on-cooldown rows"""
+    embed = discord.Embed(
+        title="⏰ Your Cooldowns",
+        description="Command cooldowns and when you can use them again",
+        color=_COOLDOWNS_COLOR
+    )
+    
+    if ready_commands:
+        embed.add_field(
+            name="✅ Ready to Use",
+            value=" • ".join(ready_commands[:10]),  # Limit to prevent embed being too long
+            inline=False
+        )
+        
+    if cooldown_commands_list:
+        embed.add_field(
+            name="⏱️ On Cooldown", 
+            value="\n".join(cooldown_commands_list[:10]),
+            inline=False
+        )
+        
+    if not ready_commands and not cooldown_commands_list:
+        embed.description = "All your commands are ready to use! 🎉"
+        
+    return embed
+
+
+# Handlers here only build embeds, so they stay plain coroutines that await once at send time.
+# Don't wrap this work in asyncio.to_thread/run_in_executor; the hop costs more than the work.
 class Utility(commands.Cog):
     """Utility commands and functionality"""
     
     def __init__(self, bot):
         self.bot = bot
+        
+        # Help pages are static, so build them once and re-send
+        self._main_help_embed, self._help_embeds = _build_help_embeds()
+        self._leaderboard_embeds = {
+            key: discord.Embed.from_dict(payload) for key, payload in _LEADERBOARD_PAYLOADS.items()
+        }
+        self._support_embed = discord.Embed.from_dict(_SUPPORT_PAYLOAD)
+        
+        # (name, Command) pairs for cooldowns, resolved on first use once every cog is loaded
+        self._cooldown_cmds = None
+        
+        # Monotonic time each user last ran a tracked command, and the embed for users with none recent
+        self._last_cmd_ts = {}
+        self._next_prune = 0.0
+        self._all_ready_embed = None
+        
+        # Built on first use since bot.user isn't set until login
+        self._invite_embed = None
+        
+    def _resolve_cooldown_commands(self):
+        """Look up the Command objects behind _COOLDOWN_COMMANDS, skipping any that aren't loaded"""
+        resolved = []
+        for cmd_name in _COOLDOWN_COMMANDS:
+            command = self.bot.get_command(cmd_name)
+            if command:
+                resolved.append((cmd_name, command))
+        return resolved
+        
+    def _build_invite_embed(self) -> discord.Embed:
+        """Build the invite embed; the URL only depends on the bot's user id"""
+        # Create invite URL with necessary permissions
+        permissions = discord.Permissions(
+            read_messages=True,
+            send_messages=True,
+            embed_links=True,
+            attach_files=True,
+            add_reactions=True,
+            use_external_emojis=True
+        )
+        
+        invite_url = discord.utils.oauth_url(self.bot.user.id, permissions=permissions)
+        
+        embed = discord.Embed(
+            title="🤖 Invite FunniGuy Bot",
+            description=f"[Click here to invite me to your server!]({invite_url})",
+            color=discord.Color.green()
+        )
+        embed.add_field(
+            name="Features",
+            value="• 80+ Commands\n• Economy System\n• Gambling Games\n• Fun Commands\n• And much more!",
+            inline=False
+        )
+        
+        return embed
 
     @commands.command(name="help")
     async def help_command(self, ctx: commands.Context, *, category: str = None):
         """Show help for all commands or a specific category"""
-        
         if category is None:
-            # Main help menu
-            embed = discord.Embed(
-                title="🤖 FunniGuy Bot - Command Help",
-                description="A complete Dank Memer clone with 80+ commands!\nUse `fg help <category>` for detailed commands.",
-                color=discord.Color.blue()
-            )
-            
-            categories = {
-                "💰 Economy": "economy - Work, beg, crime, rob, bank, shop, inventory",
-                "🎲 Gambling": "gambling - Blackjack, slots, gamble, highlow, scratch",
-                "😄 Fun": "fun - 8ball, joke, roast, hack, ship, rate, emojify",
-                "👥 Social": "social - Marriage, pets, friends, profile (coming soon)",
-                "🛠️ Utility": "utility - Help, leaderboard, settings",
-                "ℹ️ Core": "core - Ping, info, balance, daily, profile"
-            }
-            
-            for category_name, description in categories.items():
-                embed.add_field(name=category_name, value=description, inline=False)
-                
-            embed.set_footer(text="Example: fg help economy")
-            
-        elif category.lower() in ["economy", "eco", "money"]:
-            embed = discord.Embed(
-                title="💰 Economy Commands",
-                description="Make money and manage your finances!",
-                color=discord.Color.gold()
-            )
-            
-            commands_list = [
-                "`fg beg` - Beg for coins (30s cooldown)",
-                "`fg work` - Work at a job (1h cooldown)", 
-                "`fg crime` - Commit crimes for money (2h cooldown)",
-                "`fg rob @user` - Rob another user (1h cooldown)",
-                "`fg daily` - Claim daily bonus (24h cooldown)",
-                "`fg weekly` - Claim weekly bonus (7d cooldown)",
-                "`fg monthly` - Claim monthly bonus (30d cooldown)",
-                "`fg deposit <amount>` - Put coins in bank",
-                "`fg withdraw <amount>` - Take coins from bank",
-                "`fg shop` - View the item shop",
-                "`fg inventory` - View your items",
-                "`fg balance` - Check your money"
-            ]
-            
-            embed.description += "\n\n" + "\n".join(commands_list)
-            
-        elif category.lower() in ["gambling", "gamble", "games"]:
-            embed = discord.Embed(
-                title="🎲 Gambling Commands", 
-                description="Risk it all for big rewards!",
-                color=discord.Color.red()
-            )
-            
-            commands_list = [
-                "`fg gamble <amount>` - Roll dice vs bot",
-                "`fg slots <amount>` - Play slot machine",
-                "`fg blackjack <amount>` - Play blackjack",
-                "`fg highlow <amount>` - Guess higher/lower",
-                "`fg scratch <amount>` - Scratch card game"
-            ]
-            
-            embed.description += "\n\n" + "\n".join(commands_list)
-            
-        elif category.lower() in ["fun", "meme", "jokes"]:
-            embed = discord.Embed(
-                title="😄 Fun Commands",
-                description="Entertainment and meme commands!",
-                color=discord.Color.purple()
-            )
-            
-            commands_list = [
-                "`fg 8ball <question>` - Ask magic 8-ball",
-                "`fg joke` - Get a random joke",
-                "`fg roast @user` - Roast someone",
-                "`fg hack @user` - Fake hack someone",
-                "`fg ship @user1 @user2` - Ship calculator", 
-                "`fg rate <thing>` - Rate something out of 10",
-                "`fg kill @user` - Fake kill someone",
-                "`fg emojify <text>` - Convert text to emojis",
-                "`fg clap <text>` - Add clap emojis",
-                "`fg fortune` - Get fortune cookie",
-                "`fg fact` - Random fun fact"
-            ]
-            
-            embed.description += "\n\n" + "\n".join(commands_list)
-            
-        elif category.lower() in ["social", "marriage", "pets"]:
-            embed = discord.Embed(
-                title="👥 Social Commands",
-                description="Social features (coming soon!)",
-                color=discord.Color.pink()
-            )
-            
-            embed.add_field(name="Coming Soon", value="Marriage, pets, friends, trading, and more!", inline=False)
-            
-        elif category.lower() in ["utility", "util", "settings"]:
-            embed = discord.Embed(
-                title="🛠️ Utility Commands",
-                description="Helpful utility commands!",
-                color=discord.Color.green()
-            )
-            
-            commands_list = [
-                "`fg help [category]` - Show this help menu",
-                "`fg leaderboard` - View money leaderboard", 
-                "`fg ping` - Check bot latency",
-                "`fg info` - Bot information"
-            ]
-            
-            embed.description += "\n\n" + "\n".join(commands_list)
-            
+            embed = self._main_help_embed
+        elif category.lower() == "all":
+            # Every category page in one message (Discord allows up to 10 embeds)
+            await ctx.send(embeds=list(self._help_embeds.values())[:10])
+            return
         else:
+            embed = self._help_embeds.get(_HELP_ALIASES.get(category.lower()))
+            
+        if embed is None:
             embed = create_error_embed(
-                f"Unknown category '{category}'!\nValid categories: economy, gambling, fun, social, utility"
+                f"Unknown category '{category}'!\nValid categories: economy, gambling, fun, social, utility, all"
             )
             
         await ctx.send(embed=embed)
@@ -144,35 +317,8 @@ class Utility(commands.Cog):
     @commands.command(name="leaderboard", aliases=["lb", "top"])
     async def leaderboard_command(self, ctx: commands.Context, category: str = "money"):
         """Show leaderboards for various stats"""
-        
-        if category.lower() in ["money", "coins", "bal", "balance"]:
-            embed = discord.Embed(
-                title="💰 Money Leaderboard",
-                description="Top richest users (coming soon!)",
-                color=discord.Color.gold()
-            )
-            
-            # TODO: Implement actual leaderboard from database
-            embed.add_field(
-                name="🏆 Top Users",
-                value="Leaderboard system coming soon! 🚧\nYour stats are being tracked!",
-                inline=False
-            )
-            
-        elif category.lower() in ["level", "levels", "xp", "exp"]:
-            embed = discord.Embed(
-                title="⭐ Level Leaderboard",
-                description="Top users by level (coming soon!)", 
-                color=discord.Color.blue()
-            )
-            
-            embed.add_field(
-                name="🏆 Top Users",
-                value="Level leaderboard coming soon! 🚧",
-                inline=False
-            )
-            
-        else:
+        embed = self._leaderboard_embeds.get(_LB_ALIASES.get(category.lower()))
+        if embed is None:
             embed = create_error_embed(
                 f"Unknown leaderboard category '{category}'!\nValid categories: money, level"
             )
@@ -182,75 +328,56 @@ class Utility(commands.Cog):
     @commands.command(name="cooldowns", aliases=["cd"])
     async def cooldowns_command(self, ctx: commands.Context):
         """Check your command cooldowns"""
-        user_id = ctx.author.id
-        
-        embed = discord.Embed(
-            title="⏰ Your Cooldowns",
-            description="Command cooldowns and when you can use them again",
-            color=discord.Color.orange()
-        )
-        
-        # Get cooldown info from bot's command cooldowns
-        cooldown_commands = {
-            "beg": "30 seconds",
-            "work": "1 hour", 
-            "crime": "2 hours",
-            "rob": "1 hour",
-            "daily": "24 hours",
-            "weekly": "7 days",
-            "monthly": "30 days",
-            "gamble": "5 minutes",
-            "slots": "3 minutes", 
-            "blackjack": "4 minutes",
-            "highlow": "2 minutes",
-            "scratch": "10 minutes"
-        }
-        
+        if self._cooldown_cmds is None:
+            self._cooldown_cmds = self._resolve_cooldown_commands()
+            
+        # Nobody can be on cooldown without running a tracked command within the longest cooldown
+        last_used = self._last_cmd_ts.get(ctx.author.id)
+        if last_used is None or time.monotonic() - last_used > _LONGEST_COOLDOWN:
+            self._last_cmd_ts.pop(ctx.author.id, None)
+            if self._all_ready_embed is None:
+                self._all_ready_embed = _build_cooldowns_embed(
+                    [f"`{cmd_name}`" for cmd_name, _ in self._cooldown_cmds], []
+                )
+            await ctx.send(embed=self._all_ready_embed)
+            return
+            
         ready_commands = []
         cooldown_commands_list = []
         
-        for cmd_name, cooldown_time in cooldown_commands.items():
-            command = self.bot.get_command(cmd_name)
-            if command:
-                # Check if command is on cooldown
-                bucket = command._buckets.get_bucket(ctx.message)
-                retry_after = bucket.get_retry_after()
-                
-                if retry_after:
-                    # On cooldown
-                    hours, remainder = divmod(int(retry_after), 3600)
-                    minutes, seconds = divmod(remainder, 60)
-                    
-                    if hours:
-                        time_left = f"{hours}h {minutes}m {seconds}s"
-                    elif minutes:
-                        time_left = f"{minutes}m {seconds}s"
-                    else:
-                        time_left = f"{seconds}s"
-                        
-                    cooldown_commands_list.append(f"`{cmd_name}` - {time_left} left")
-                else:
-                    # Ready to use
-                    ready_commands.append(f"`{cmd_name}`")
-                    
-        if ready_commands:
-            embed.add_field(
-                name="✅ Ready to Use",
-                value=" • ".join(ready_commands[:10]),  # Limit to prevent embed being too long
-                inline=False
-            )
-            
-        if cooldown_commands_list:
-            embed.add_field(
-                name="⏱️ On Cooldown", 
-                value="\n".join(cooldown_commands_list[:10]),
-                inline=False
-            )
+        # One clock read for every bucket (discord.py cooldowns run on time.time())
+        now = time.time()
+        for cmd_name, command in self._cooldown_cmds:
+            # Check if command is on cooldown
+            bucket = command._buckets.get_bucket(ctx.message, now)
+            retry_after = bucket.get_retry_after(now)
             
-        if not ready_commands and not cooldown_commands_list:
-            embed.description = "All your commands are ready to use! 🎉"
+            if retry_after:
+                # On cooldown
+                hours, remainder = divmod(int(retry_after), 3600)
+                minutes, seconds = divmod(remainder, 60)
+                time_left = (f"{hours}h " if hours else "") + (f"{minutes}m " if hours or minutes else "") + f"{seconds}s"
+                cooldown_commands_list.append(f"`{cmd_name}` - {time_left} left")
+            else:
+                # Ready to use
+                ready_commands.append(f"`{cmd_name}`")
+                
+        await ctx.send(embed=_build_cooldowns_embed(ready_commands, cooldown_commands_list))
+        
+    @commands.Cog.listener()
+    async def on_command(self, ctx: commands.Context):
+        """Remember when each user last ran a command that `fg cooldowns` reports on"""
+        if ctx.command.name not in _COOLDOWN_COMMAND_NAMES:
+            return
             
-        await ctx.send(embed=embed)
+        now = time.monotonic()
+        self._last_cmd_ts[ctx.author.id] = now
+        
+        # Drop users whose last tracked command is older than any cooldown so the map doesn't grow forever
+        if now >= self._next_prune:
+            self._next_prune = now + _LAST_USED_PRUNE_INTERVAL
+            cutoff = now - _LONGEST_COOLDOWN
+            self._last_cmd_ts = {user_id: ts for user_id, ts in self._last_cmd_ts.items() if ts > cutoff}
 
     @commands.command(name="stats")
     async def stats_command(self, ctx: commands.Context, user: discord.Member = None):
@@ -258,20 +385,7 @@ class Utility(commands.Cog):
         if user is None:
             user = ctx.author
             
-        embed = discord.Embed(
-            title=f"📊 {user.display_name}'s Statistics",
-            color=discord.Color.blue()
-        )
-        
-        # TODO: Get actual stats from database
-        embed.add_field(name="Commands Used", value="Coming soon! 🚧", inline=True)
-        embed.add_field(name="Money Earned", value="Coming soon! 🚧", inline=True) 
-        embed.add_field(name="Gambling Wins", value="Coming soon! 🚧", inline=True)
-        embed.add_field(name="Items Owned", value="Coming soon! 🚧", inline=True)
-        embed.add_field(name="Achievement Points", value="Coming soon! 🚧", inline=True)
-        embed.add_field(name="Level", value="Coming soon! 🚧", inline=True)
-        
-        embed.set_footer(text="Detailed statistics system coming soon!")
+        embed = discord.Embed.from_dict({**_STATS_PAYLOAD, "title": f"📊 {user.display_name}'s Statistics"})
         await ctx.send(embed=embed)
 
     @commands.command(name="prefix")
@@ -288,73 +402,24 @@ class Utility(commands.Cog):
             return
             
         if len(new_prefix) > 5:
-            embed = create_error_embed("Prefix cannot be longer than 5 characters!")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=_PREFIX_LENGTH_ERROR)
             return
             
         # For now, just show a message. In a real implementation, 
         # you'd save this to the database per-guild
-        embed = create_info_embed(
-            f"Prefix change is not implemented yet! 🚧\n"
-            f"The bot will always use `fg ` as the prefix for now.",
-            title="Prefix Change"
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_PREFIX_UNSUPPORTED_INFO)
 
     @commands.command(name="invite")
     async def invite_command(self, ctx: commands.Context):
         """Get bot invite link"""
-        # Create invite URL with necessary permissions
-        permissions = discord.Permissions(
-            read_messages=True,
-            send_messages=True,
-            embed_links=True,
-            attach_files=True,
-            add_reactions=True,
-            use_external_emojis=True
-        )
-        
-        invite_url = discord.utils.oauth_url(self.bot.user.id, permissions=permissions)
-        
-        embed = discord.Embed(
-            title="🤖 Invite FunniGuy Bot",
-            description=f"[Click here to invite me to your server!]({invite_url})",
-            color=discord.Color.green()
-        )
-        embed.add_field(
-            name="Features",
-            value="• 80+ Commands\n• Economy System\n• Gambling Games\n• Fun Commands\n• And much more!",
-            inline=False
-        )
-        
-        await ctx.send(embed=embed)
+        if self._invite_embed is None:
+            self._invite_embed = self._build_invite_embed()
+        await ctx.send(embed=self._invite_embed)
 
     @commands.command(name="support")
     async def support_command(self, ctx: commands.Context):
         """Get support information"""
-        embed = discord.Embed(
-            title="🆘 Support & Information",
-            description="Need help with FunniGuy Bot?",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="📚 Commands",
-            value="Use `fg help` to see all commands!",
-            inline=False
-        )
-        embed.add_field(
-            name="🐛 Found a Bug?",
-            value="This bot is a Dank Memer clone created by AI!\nReport issues to your bot admin.",
-            inline=False
-        )
-        embed.add_field(
-            name="💡 Suggestions",
-            value="Have ideas for new features? Let us know!",
-            inline=False
-        )
-        
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._support_embed)
 
 
 async def setup(bot):
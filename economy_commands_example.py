@@ -2,30 +2,89 @@
 FunniGuy Discord Bot - Economy Commands Example
 Comprehensive demonstration of the economy system features
 """
+import asyncio
 import discord
 from discord.ext import commands
-from utils.economy_manager import EconomyManager
-from utils.inventory_manager import InventoryManager
-from utils.database_manager import DatabaseManager
+from utils.economy_manager import BANK_TIER_FEATURES
 import logging
+import time
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Embed colors
+_C_OK = 0x00ff00
+_C_ERR = 0xff0000
+_C_WARN = 0xff9900
+_C_SPECIAL = 0x9932cc  # prestige and item effects
+_C_BANK = 0x4169e1
+_C_LOAN_OK = 0x32cd32
+_C_LOAN_DENIED = 0xff6347
+
+_CRIME_TYPES = ("petty_theft", "pickpocket", "burglary", "bank_heist", "cyber_crime")
+_VALID_CRIMES = frozenset(_CRIME_TYPES)
+_INVALID_CRIME_MSG = f"❌ Invalid crime type! Choose from: {', '.join(_CRIME_TYPES)}"
+
+# Seconds for the best bank tier's passive rate to accrue one coin; any sooner collects nothing
+_PASSIVE_MIN_INTERVAL = 3600 / max(features['passive_income_rate'] for features in BANK_TIER_FEATURES)
+
+
+@lru_cache(maxsize=None)
+def _effect_label(effect_type: str) -> str:
+    """Display name for an effect type; there are only a handful, so each is built once"""
+    return effect_type.replace('_', ' ').title()
+
+
+def _format_effect(effect: dict) -> str:
+    """Format one active effect as '**Name:** +bonus'"""
+    effect_type = effect.get('effect_type', 'unknown')
+    value = effect.get('value', 0)
+    if effect_type.endswith('_multiplier'):
+        return f"**{_effect_label(effect_type)}:** +{value*100:.0f}%"
+    return f"**{_effect_label(effect_type)}:** +{value}"
+
+
 class EconomyCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = DatabaseManager()
-        self.economy = EconomyManager(self.db)
-        self.inventory = InventoryManager(self.db)
+        # Share the bot's managers (and their cache) instead of opening a second set
+        self.db = bot.data_manager.db
+        self.economy = bot.data_manager.economy
+        self.inventory = bot.data_manager.inventory
+        
+        # Monotonic time before which a user's passive income can't have accrued a coin
+        self._passive_next = {}
+        
+        # Fixed parts of the per-user embeds; commands fill in a copy
+        self._bank_template = discord.Embed(title="🏛️ Bank Information", color=_C_BANK)
+        self._loan_template = discord.Embed(title="💰 Loan Information")
+        self._effects_template = discord.Embed(
+            title="✨ Active Effects",
+            description="Your currently active item bonuses",
+            color=_C_SPECIAL
+        )
+        
+        # Sent as-is whenever there's nothing to collect
+        self._passive_empty_embed = discord.Embed(
+            title="📈 Passive Income",
+            description="No passive income to collect right now",
+            color=_C_WARN
+        )
+        self._passive_empty_embed.add_field(
+            name="Requirements",
+            value="• Bank tier 2+ required\n• Income accumulates over time",
+            inline=False
+        )
 
     # === BASIC ECONOMY ===
     
     @commands.command(name='balance', aliases=['bal', 'money'])
+    @commands.cooldown(3, 5, commands.BucketType.user)  # 3 uses per 5 seconds
     async def balance(self, ctx):
         """Check your current balance and economy stats"""
         try:
             user_id = ctx.author.id
-            stats = await self.economy.get_economy_stats(user_id)
+            stats = await self.economy.get_full_profile(user_id)
             
             if not stats:
                 await ctx.send("❌ Economy data not found. Use `!register` first!")
@@ -34,55 +93,52 @@ class EconomyCommands(commands.Cog):
             balances = stats['balances']
             lifetime = stats['lifetime']
             gambling = stats['gambling']
-            
-            # Get prestige info
-            prestige_data = await self.economy.get_user_prestige(user_id)
-            prestige_level = prestige_data.get('prestige_level', 0) if prestige_data else 0
-            prestige_mult = prestige_data.get('prestige_multiplier', 1.0) if prestige_data else 1.0
-            
-            embed = discord.Embed(
-                title="💰 Economy Status",
-                description=f"Financial overview for {ctx.author.display_name}",
-                color=0x00ff00
-            )
-            
-            embed.add_field(
-                name="💵 Current Balances",
-                value=f"**Pocket:** {balances['pocket']:,} coins\n"
-                      f"**Bank:** {balances['bank']:,}/{balances['bank_capacity']:,} coins\n"
-                      f"**Total:** {balances['total']:,} coins",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📊 Lifetime Stats",
-                value=f"**Total Earned:** {lifetime['total_earned']:,} coins\n"
-                      f"**Total Spent:** {lifetime['total_spent']:,} coins\n"
-                      f"**Net Worth:** {lifetime['net_worth']:,} coins",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="🎯 Prestige",
-                value=f"**Level:** {prestige_level}\n"
-                      f"**Multiplier:** {prestige_mult:.1f}x\n"
-                      f"**Status:** {'Elite' if prestige_level >= 3 else 'Growing'}",
-                inline=True
-            )
+            prestige_level = stats['prestige']['level']
+            prestige_mult = stats['prestige']['multiplier']
+            
+            fields = [
+                {
+                    "name": "💵 Current Balances",
+                    "value": f"**Pocket:** {balances['pocket']:,} coins\n"
+                             f"**Bank:** {balances['bank']:,}/{balances['bank_capacity']:,} coins\n"
+                             f"**Total:** {balances['total']:,} coins",
+                    "inline": True
+                },
+                {
+                    "name": "📊 Lifetime Stats",
+                    "value": f"**Total Earned:** {lifetime['total_earned']:,} coins\n"
+                             f"**Total Spent:** {lifetime['total_spent']:,} coins\n"
+                             f"**Net Worth:** {lifetime['net_worth']:,} coins",
+                    "inline": True
+                },
+                {
+                    "name": "🎯 Prestige",
+                    "value": f"**Level:** {prestige_level}\n"
+                             f"**Multiplier:** {prestige_mult:.1f}x\n"
+                             f"**Status:** {'Elite' if prestige_level >= 3 else 'Growing'}",
+                    "inline": True
+                }
+            ]
             
             if gambling['total_gambled'] > 0:
-                embed.add_field(
-                    name="🎰 Gambling",
-                    value=f"**Gambled:** {gambling['total_gambled']:,} coins\n"
-                          f"**Won:** {gambling['total_won']:,} coins\n"
-                          f"**Streak:** {gambling['gambling_streak']}",
-                    inline=True
-                )
-            
+                fields.append({
+                    "name": "🎰 Gambling",
+                    "value": f"**Gambled:** {gambling['total_gambled']:,} coins\n"
+                             f"**Won:** {gambling['total_won']:,} coins\n"
+                             f"**Streak:** {gambling['gambling_streak']}",
+                    "inline": True
+                })
+            
+            embed = discord.Embed.from_dict({
+                "title": "💰 Economy Status",
+                "description": f"Financial overview for {ctx.author.display_name}",
+                "color": _C_OK,
+                "fields": fields
+            })
             await ctx.send(embed=embed)
             
         except Exception as e:
-            logger.error(f"Error in balance command: {e}")
+            logger.error("Error in balance command: %s", e)
             await ctx.send("❌ Error retrieving balance information")
 
     @commands.command(name='crime')
@@ -91,9 +147,8 @@ class EconomyCommands(commands.Cog):
         try:
             user_id = ctx.author.id
             
-            valid_crimes = ["petty_theft", "pickpocket", "burglary", "bank_heist", "cyber_crime"]
-            if crime_type not in valid_crimes:
-                await ctx.send(f"❌ Invalid crime type! Choose from: {', '.join(valid_crimes)}")
+            if crime_type not in _VALID_CRIMES:
+                await ctx.send(_INVALID_CRIME_MSG)
                 return
             
             success, money_change, description, caught = await self.economy.commit_crime(user_id, crime_type)
@@ -102,14 +157,14 @@ class EconomyCommands(commands.Cog):
                 embed = discord.Embed(
                     title="🎭 Crime Success!",
                     description=description,
-                    color=0x00ff00
+                    color=_C_OK
                 )
                 embed.add_field(name="💰 Earned", value=f"{money_change:,} coins", inline=True)
             else:
                 embed = discord.Embed(
                     title="🚔 Crime Failed!",
                     description=description,
-                    color=0xff0000
+                    color=_C_ERR
                 )
                 if caught:
                     embed.add_field(name="💸 Fine", value=f"{money_change:,} coins", inline=True)
@@ -117,7 +172,7 @@ class EconomyCommands(commands.Cog):
             await ctx.send(embed=embed)
             
         except Exception as e:
-            logger.error(f"Error in crime command: {e}")
+            logger.error("Error in crime command: %s", e)
             await ctx.send("❌ Crime attempt failed due to technical issues")
 
     @commands.command(name='rob')
@@ -133,7 +188,7 @@ class EconomyCommands(commands.Cog):
                 embed = discord.Embed(
                     title="💰 Robbery Success!",
                     description=description,
-                    color=0x00ff00
+                    color=_C_OK
                 )
                 embed.add_field(name="💎 Stolen", value=f"{amount:,} coins", inline=True)
                 embed.add_field(name="🎯 Target", value=target.mention, inline=True)
@@ -141,7 +196,7 @@ class EconomyCommands(commands.Cog):
                 embed = discord.Embed(
                     title="🚫 Robbery Failed!",
                     description=description,
-                    color=0xff0000
+                    color=_C_ERR
                 )
                 if "fined" in description:
                     embed.add_field(name="💸 Fine", value=f"{amount:,} coins", inline=True)
@@ -149,7 +204,7 @@ class EconomyCommands(commands.Cog):
             await ctx.send(embed=embed)
             
         except Exception as e:
-            logger.error(f"Error in rob command: {e}")
+            logger.error("Error in rob command: %s", e)
             await ctx.send("❌ Robbery attempt failed")
 
     # === PRESTIGE SYSTEM ===
@@ -162,21 +217,23 @@ class EconomyCommands(commands.Cog):
             
             if confirm != "confirm":
                 # Show prestige info
-                eligible, next_level, requirement = await self.economy.check_prestige_eligibility(user_id)
-                economy_data = await self.economy.get_user_economy(user_id)
+                (eligible, next_level, requirement), economy_data, prestige_data = await asyncio.gather(
+                    self.economy.check_prestige_eligibility(user_id),
+                    self.economy.get_user_economy(user_id),
+                    self.economy.get_user_prestige(user_id)
+                )
                 
                 if not economy_data:
                     await ctx.send("❌ Economy data not found!")
                     return
                 
                 total_earned = economy_data.get('total_earned', 0)
-                prestige_data = await self.economy.get_user_prestige(user_id)
                 current_prestige = prestige_data.get('prestige_level', 0) if prestige_data else 0
                 
                 embed = discord.Embed(
                     title="⭐ Prestige System",
                     description="Reset your progress for permanent bonuses!",
-                    color=0x9932cc
+                    color=_C_SPECIAL
                 )
                 
                 embed.add_field(
@@ -188,7 +245,7 @@ class EconomyCommands(commands.Cog):
                 )
                 
                 if eligible:
-                    multiplier = self.economy.prestige_multipliers.get(next_level, 1.0)
+                    multiplier = self.economy.prestige_multipliers[next_level]
                     embed.add_field(
                         name="✅ Ready to Prestige!",
                         value=f"**New Level:** {next_level}\n"
@@ -197,7 +254,7 @@ class EconomyCommands(commands.Cog):
                               f"Use `!prestige confirm` to proceed",
                         inline=False
                     )
-                    embed.color = 0x00ff00
+                    embed.color = _C_OK
                 else:
                     needed = requirement - total_earned
                     embed.add_field(
@@ -205,7 +262,7 @@ class EconomyCommands(commands.Cog):
                         value=f"Need {needed:,} more coins earned",
                         inline=False
                     )
-                    embed.color = 0xff9900
+                    embed.color = _C_WARN
                 
                 await ctx.send(embed=embed)
                 return
@@ -217,7 +274,7 @@ class EconomyCommands(commands.Cog):
                 embed = discord.Embed(
                     title="⭐ PRESTIGE ACHIEVED!",
                     description=f"Welcome to Prestige Level {prestige_info['new_prestige_level']}!",
-                    color=0x00ff00
+                    color=_C_OK
                 )
                 embed.add_field(
                     name="🎊 New Benefits",
@@ -235,18 +292,19 @@ class EconomyCommands(commands.Cog):
                 embed = discord.Embed(
                     title="❌ Prestige Failed",
                     description=prestige_info.get('error', 'Unknown error'),
-                    color=0xff0000
+                    color=_C_ERR
                 )
             
             await ctx.send(embed=embed)
             
         except Exception as e:
-            logger.error(f"Error in prestige command: {e}")
+            logger.error("Error in prestige command: %s", e)
             await ctx.send("❌ Error with prestige system")
 
     # === ADVANCED BANKING ===
     
     @commands.command(name='bank')
+    @commands.cooldown(3, 5, commands.BucketType.user)  # 3 uses per 5 seconds
     async def bank_info(self, ctx):
         """View bank information and tier details"""
         try:
@@ -264,11 +322,8 @@ class EconomyCommands(commands.Cog):
             # Get tier features
             tier_features = self.economy._get_bank_tier_features(bank_tier)
             
-            embed = discord.Embed(
-                title="🏛️ Bank Information",
-                description=f"Your Tier {bank_tier} Banking Account",
-                color=0x4169e1
-            )
+            embed = self._bank_template.copy()
+            embed.description = f"Your Tier {bank_tier} Banking Account"
             
             embed.add_field(
                 name="💳 Account Details",
@@ -321,7 +376,7 @@ class EconomyCommands(commands.Cog):
             await ctx.send(embed=embed)
             
         except Exception as e:
-            logger.error(f"Error in bank command: {e}")
+            logger.error("Error in bank command: %s", e)
             await ctx.send("❌ Error retrieving bank information")
 
     @commands.command(name='loan')
@@ -330,16 +385,35 @@ class EconomyCommands(commands.Cog):
         try:
             user_id = ctx.author.id
             
+            # Reject amounts the economy manager would refuse anyway, before touching the database
+            if action == "take" and amount is not None and amount < 1000:
+                embed = discord.Embed(
+                    title="❌ Loan Denied",
+                    description="Minimum loan amount is 1000 coins",
+                    color=_C_ERR
+                )
+                await ctx.send(embed=embed)
+                return
+            
+            if action == "repay" and amount is not None and amount <= 0:
+                embed = discord.Embed(
+                    title="❌ Payment Failed",
+                    description="Repayment amount must be positive",
+                    color=_C_ERR
+                )
+                await ctx.send(embed=embed)
+                return
+            
             if action is None:
                 # Show loan info
-                eligible, max_loan, interest_rate = await self.economy.get_loan_eligibility(user_id)
-                economy_data = await self.economy.get_user_economy(user_id)
+                (eligible, max_loan, interest_rate), economy_data = await asyncio.gather(
+                    self.economy.get_loan_eligibility(user_id),
+                    self.economy.get_user_economy(user_id)
+                )
                 current_loan = economy_data.get('current_loan', 0) if economy_data else 0
                 
-                embed = discord.Embed(
-                    title="💰 Loan Information",
-                    color=0x32cd32 if eligible else 0xff6347
-                )
+                embed = self._loan_template.copy()
+                embed.color = _C_LOAN_OK if eligible else _C_LOAN_DENIED
                 
                 if current_loan > 0:
                     embed.add_field(
@@ -375,7 +449,7 @@ class EconomyCommands(commands.Cog):
                     embed = discord.Embed(
                         title="💰 Loan Approved!",
                         description=f"You have borrowed {amount:,} coins",
-                        color=0x00ff00
+                        color=_C_OK
                     )
                     embed.add_field(
                         name="📋 Loan Details",
@@ -388,7 +462,7 @@ class EconomyCommands(commands.Cog):
                     embed = discord.Embed(
                         title="❌ Loan Denied",
                         description=loan_info.get('error', 'Unknown error'),
-                        color=0xff0000
+                        color=_C_ERR
                     )
                 
                 await ctx.send(embed=embed)
@@ -400,7 +474,7 @@ class EconomyCommands(commands.Cog):
                     embed = discord.Embed(
                         title="✅ Loan Payment",
                         description=f"Repaid {repay_info['amount_paid']:,} coins",
-                        color=0x00ff00
+                        color=_C_OK
                     )
                     
                     if repay_info['fully_paid']:
@@ -419,7 +493,7 @@ class EconomyCommands(commands.Cog):
                     embed = discord.Embed(
                         title="❌ Payment Failed",
                         description=repay_info.get('error', 'Unknown error'),
-                        color=0xff0000
+                        color=_C_ERR
                     )
                 
                 await ctx.send(embed=embed)
@@ -427,21 +501,29 @@ class EconomyCommands(commands.Cog):
                 await ctx.send("❌ Invalid loan command! Use: `!loan` (info), `!loan take <amount>`, or `!loan repay [amount]`")
             
         except Exception as e:
-            logger.error(f"Error in loan command: {e}")
+            logger.error("Error in loan command: %s", e)
             await ctx.send("❌ Error with loan system")
 
     @commands.command(name='passive')
+    @commands.cooldown(3, 5, commands.BucketType.user)  # 3 uses per 5 seconds
     async def passive_income(self, ctx):
         """Collect accumulated passive income"""
         try:
             user_id = ctx.author.id
+            
+            # Right after a collection nothing has accrued yet, so skip the read
+            if time.monotonic() < self._passive_next.get(user_id, 0.0):
+                await ctx.send(embed=self._passive_empty_embed)
+                return
+            
             success, income = await self.economy.collect_passive_income(user_id)
             
             if success and income > 0:
+                self._passive_next[user_id] = time.monotonic() + _PASSIVE_MIN_INTERVAL
                 embed = discord.Embed(
                     title="📈 Passive Income Collected!",
                     description=f"You collected {income:,} coins from passive income",
-                    color=0x00ff00
+                    color=_C_OK
                 )
                 embed.add_field(
                     name="💡 Tip",
@@ -449,37 +531,25 @@ class EconomyCommands(commands.Cog):
                     inline=False
                 )
             else:
-                embed = discord.Embed(
-                    title="📈 Passive Income",
-                    description="No passive income to collect right now",
-                    color=0xff9900
-                )
-                embed.add_field(
-                    name="Requirements",
-                    value="• Bank tier 2+ required\n• Income accumulates over time",
-                    inline=False
-                )
+                embed = self._passive_empty_embed
             
             await ctx.send(embed=embed)
             
         except Exception as e:
-            logger.error(f"Error in passive command: {e}")
+            logger.error("Error in passive command: %s", e)
             await ctx.send("❌ Error collecting passive income")
 
     # === ITEM EFFECTS SYSTEM ===
     
     @commands.command(name='effects')
+    @commands.cooldown(3, 5, commands.BucketType.user)  # 3 uses per 5 seconds
     async def active_effects(self, ctx):
         """View your currently active item effects"""
         try:
             user_id = ctx.author.id
             effects_data = await self.economy.get_user_active_effects(user_id)
             
-            embed = discord.Embed(
-                title="✨ Active Effects",
-                description="Your currently active item bonuses",
-                color=0x9932cc
-            )
+            embed = self._effects_template.copy()
             
             if not effects_data:
                 embed.add_field(
@@ -494,16 +564,9 @@ class EconomyCommands(commands.Cog):
             perm_effects = effects_data.get('permanent_effects', [])
             
             if temp_effects:
-                temp_text = []
-                for effect in temp_effects:
-                    effect_type = effect.get('effect_type', 'unknown')
-                    value = effect.get('value', 0)
-                    duration = effect.get('duration', 0)
-                    
-                    if effect_type.endswith('_multiplier'):
-                        temp_text.append(f"**{effect_type.replace('_', ' ').title()}:** +{value*100:.0f}% ({duration}s left)")
-                    else:
-                        temp_text.append(f"**{effect_type.replace('_', ' ').title()}:** +{value} ({duration}s left)")
+                temp_text = [
+                    f"{_format_effect(effect)} ({effect.get('duration', 0)}s left)" for effect in temp_effects
+                ]
                 
                 embed.add_field(
                     name="⏰ Temporary Effects",
@@ -512,15 +575,7 @@ class EconomyCommands(commands.Cog):
                 )
             
             if perm_effects:
-                perm_text = []
-                for effect in perm_effects:
-                    effect_type = effect.get('effect_type', 'unknown')
-                    value = effect.get('value', 0)
-                    
-                    if effect_type.endswith('_multiplier'):
-                        perm_text.append(f"**{effect_type.replace('_', ' ').title()}:** +{value*100:.0f}%")
-                    else:
-                        perm_text.append(f"**{effect_type.replace('_', ' ').title()}:** +{value}")
+                perm_text = [_format_effect(effect) for effect in perm_effects]
                 
                 embed.add_field(
                     name="🔮 Permanent Effects",
@@ -538,7 +593,7 @@ class EconomyCommands(commands.Cog):
             await ctx.send(embed=embed)
             
         except Exception as e:
-            logger.error(f"Error in effects command: {e}")
+            logger.error("Error in effects command: %s", e)
             await ctx.send("❌ Error retrieving active effects")
 
 async def setup(bot):
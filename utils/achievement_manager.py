@@ -2,6 +2,7 @@
 Achievement Management System for FunniGuy Discord Bot
 Handles achievement tracking, progress, rewards, and unlocks
 """
+import os
 import asyncio
 import logging
 from typing import Dict, List, Optional, Any, Tuple
@@ -32,6 +33,11 @@ class AchievementManager:
         self.db = database_manager
         self.validator = SchemaValidator()
         
+        # Parsed achievements.json, re-read only when the file's mtime changes
+        self._achievements_cache = None
+        self._achievements_mtime = None
+        self._achievements_lock = asyncio.Lock()
+        
         # Achievement categories and their progress tracking
         self.achievement_progress_handlers = {
             AchievementType.COMMAND_USAGE: self._track_command_usage,
@@ -70,12 +76,23 @@ class AchievementManager:
         """
         try:
             achievements_file = self.db.global_dir / "achievements.json"
-            achievements_data = await self.db._read_json_file(achievements_file)
             
-            if achievements_data is None:
+            try:
+                mtime = os.stat(achievements_file).st_mtime
+            except FileNotFoundError:
                 return DEFAULT_ACHIEVEMENTS
             
-            return achievements_data
+            if self._achievements_cache is not None and mtime == self._achievements_mtime:
+                return self._achievements_cache
+            
+            # Concurrent misses wait for a single read instead of each parsing the file
+            async with self._achievements_lock:
+                if self._achievements_cache is None or mtime != self._achievements_mtime:
+                    achievements_data = await self.db._read_json_file(achievements_file)
+                    self._achievements_cache = DEFAULT_ACHIEVEMENTS if achievements_data is None else achievements_data
+                    self._achievements_mtime = mtime
+            
+            return self._achievements_cache
             
         except Exception as e:
             logger.error(f"Error getting all achievements: {e}")
@@ -95,88 +112,98 @@ class AchievementManager:
             Tuple of (progress_updated, achievement_unlocked, achievement_data)
         """
         try:
-            # Get achievement definition
             all_achievements = await self.get_all_achievements()
             if achievement_id not in all_achievements:
                 return False, False, {}
             
-            achievement_def = all_achievements[achievement_id]
-            requirement = achievement_def.get('requirement', 1)
-            
-            # Get user's current achievement data
-            user_achievements = await self.get_user_achievements(user_id)
-            if not user_achievements:
-                raise DatabaseError(f"Achievement data not found for user {user_id}")
-            
-            # Check if already unlocked
-            if achievement_id in user_achievements.get('unlocked', {}):
-                return False, False, achievement_def
-            
-            # Update progress
-            progress = user_achievements.setdefault('progress', {})
-            old_progress = progress.get(achievement_id, 0)
-            
-            if current_value > old_progress:
-                progress[achievement_id] = current_value
-                
-                # Check if achievement is complete
-                if current_value >= requirement:
-                    await self._unlock_achievement(user_id, achievement_id, user_achievements, achievement_def)
-                    return True, True, achievement_def
-                else:
-                    # Just progress update
-                    await self.db.save_user_data(user_id, 'achievements', user_achievements)
-                    return True, False, achievement_def
-            
-            return False, False, achievement_def
+            progressed, unlocked = await self._apply_milestones(user_id, {achievement_id: current_value})
+            return achievement_id in progressed, achievement_id in unlocked, all_achievements[achievement_id]
             
         except Exception as e:
             logger.error(f"Error checking achievement progress for user {user_id}: {e}")
             return False, False, {}
     
-    async def _unlock_achievement(self, user_id: int, achievement_id: str, 
-                                 user_achievements: Dict[str, Any], 
-                                 achievement_def: Dict[str, Any]):
+    async def _apply_milestones(self, user_id: int, 
+                                milestone_values: Dict[str, int]) -> Tuple[List[str], List[str]]:
         """
-        Unlock an achievement and award rewards
+        Update progress for several achievements with one read and one write
         
         Args:
             user_id: Discord user ID
-            achievement_id: ID of the achievement to unlock
-            user_achievements: User's achievement data
-            achievement_def: Achievement definition
-        """
-        try:
-            # Mark as unlocked
-            user_achievements.setdefault('unlocked', {})[achievement_id] = datetime.utcnow().isoformat()
-            user_achievements['total_unlocked'] = user_achievements.get('total_unlocked', 0) + 1
+            milestone_values: Current progress value keyed by achievement ID
             
-            # Calculate achievement points (based on rarity/difficulty)
-            points = self._calculate_achievement_points(achievement_def)
-            user_achievements['achievement_points'] = user_achievements.get('achievement_points', 0) + points
+        Returns:
+            Tuple of (progressed_ids, unlocked_ids)
+        """
+        all_achievements = await self.get_all_achievements()
+        
+        user_achievements = await self.get_user_achievements(user_id)
+        if not user_achievements:
+            raise DatabaseError(f"Achievement data not found for user {user_id}")
+        
+        unlocked = user_achievements.get('unlocked', {})
+        progress = user_achievements.setdefault('progress', {})
+        progressed_ids = []
+        unlocked_defs = {}
+        
+        for achievement_id, current_value in milestone_values.items():
+            achievement_def = all_achievements.get(achievement_id)
+            if achievement_def is None or achievement_id in unlocked:
+                continue
             
-            # Save achievement data
+            if current_value > progress.get(achievement_id, 0):
+                progress[achievement_id] = current_value
+                progressed_ids.append(achievement_id)
+                
+                if current_value >= achievement_def.get('requirement', 1):
+                    self._mark_unlocked(user_achievements, achievement_id, achievement_def)
+                    unlocked_defs[achievement_id] = achievement_def
+        
+        if progressed_ids:
             await self.db.save_user_data(user_id, 'achievements', user_achievements)
-            
-            # Award rewards
-            await self._award_achievement_rewards(user_id, achievement_def)
-            
-            logger.info(f"User {user_id} unlocked achievement: {achievement_id}")
-            
-        except Exception as e:
-            logger.error(f"Error unlocking achievement for user {user_id}: {e}")
+        
+        if unlocked_defs:
+            await self._award_achievement_rewards(user_id, list(unlocked_defs.values()))
+            for achievement_id in unlocked_defs:
+                logger.info(f"User {user_id} unlocked achievement: {achievement_id}")
+        
+        return progressed_ids, list(unlocked_defs)
     
-    async def _award_achievement_rewards(self, user_id: int, achievement_def: Dict[str, Any]):
+    def _mark_unlocked(self, user_achievements: Dict[str, Any], achievement_id: str, 
+                       achievement_def: Dict[str, Any]):
         """
-        Award rewards for unlocking an achievement
+        Record an unlock and its achievement points on the user's achievement data
+        
+        Args:
+            user_achievements: User's achievement data, updated in place
+            achievement_id: ID of the achievement to unlock
+            achievement_def: Achievement definition
+        """
+        user_achievements.setdefault('unlocked', {})[achievement_id] = datetime.utcnow().isoformat()
+        user_achievements['total_unlocked'] = user_achievements.get('total_unlocked', 0) + 1
+        
+        # Calculate achievement points (based on rarity/difficulty)
+        points = self._calculate_achievement_points(achievement_def)
+        user_achievements['achievement_points'] = user_achievements.get('achievement_points', 0) + points
+    
+    async def _award_achievement_rewards(self, user_id: int, achievement_defs: List[Dict[str, Any]]):
+        """
+        Award the combined rewards for a batch of unlocked achievements
         
         Args:
             user_id: Discord user ID
-            achievement_def: Achievement definition with rewards
+            achievement_defs: Definitions of the achievements just unlocked
         """
         try:
+            coin_reward = sum(achievement_def.get('reward_coins', 0) for achievement_def in achievement_defs)
+            exp_reward = sum(achievement_def.get('reward_experience', 0) for achievement_def in achievement_defs)
+            item_rewards = [
+                item_id
+                for achievement_def in achievement_defs
+                for item_id in achievement_def.get('reward_items', [])
+            ]
+            
             # Award coins
-            coin_reward = achievement_def.get('reward_coins', 0)
             if coin_reward > 0:
                 economy_data = await self.db.get_user_data(user_id, 'economy')
                 if economy_data:
@@ -185,7 +212,6 @@ class AchievementManager:
                     await self.db.save_user_data(user_id, 'economy', economy_data)
             
             # Award experience
-            exp_reward = achievement_def.get('reward_experience', 0)
             if exp_reward > 0:
                 profile_data = await self.db.get_user_data(user_id, 'profile')
                 if profile_data:
@@ -193,7 +219,6 @@ class AchievementManager:
                     await self.db.save_user_data(user_id, 'profile', profile_data)
             
             # Award items
-            item_rewards = achievement_def.get('reward_items', [])
             if item_rewards:
                 inventory_data = await self.db.get_user_data(user_id, 'inventory')
                 if inventory_data:
@@ -263,11 +288,13 @@ class AchievementManager:
                 'command_god': 10000
             }
             
-            for achievement_id, requirement in command_achievements.items():
-                if total_commands >= requirement:
-                    _, unlocked, _ = await self.check_achievement_progress(user_id, achievement_id, total_commands)
-                    if unlocked:
-                        unlocked_achievements.append(achievement_id)
+            reached = {
+                achievement_id: total_commands
+                for achievement_id, requirement in command_achievements.items()
+                if total_commands >= requirement
+            }
+            if reached:
+                _, unlocked_achievements = await self._apply_milestones(user_id, reached)
             
         except Exception as e:
             logger.error(f"Error tracking command usage achievements for user {user_id}: {e}")
@@ -299,11 +326,13 @@ class AchievementManager:
                 'gambling_winner': {'type': 'gambling_wins', 'requirement': 100}
             }
             
-            for achievement_id, data in economy_achievements.items():
-                if data['type'] == achievement_type and value >= data['requirement']:
-                    _, unlocked, _ = await self.check_achievement_progress(user_id, achievement_id, value)
-                    if unlocked:
-                        unlocked_achievements.append(achievement_id)
+            reached = {
+                achievement_id: value
+                for achievement_id, data in economy_achievements.items()
+                if data['type'] == achievement_type and value >= data['requirement']
+            }
+            if reached:
+                _, unlocked_achievements = await self._apply_milestones(user_id, reached)
             
         except Exception as e:
             logger.error(f"Error tracking economy achievements for user {user_id}: {e}")
@@ -334,11 +363,13 @@ class AchievementManager:
                 'achievement_hunter': {'type': 'achievements', 'requirement': 10}
             }
             
-            for achievement_id, data in collection_achievements.items():
-                if data['type'] == collection_type and count >= data['requirement']:
-                    _, unlocked, _ = await self.check_achievement_progress(user_id, achievement_id, count)
-                    if unlocked:
-                        unlocked_achievements.append(achievement_id)
+            reached = {
+                achievement_id: count
+                for achievement_id, data in collection_achievements.items()
+                if data['type'] == collection_type and count >= data['requirement']
+            }
+            if reached:
+                _, unlocked_achievements = await self._apply_milestones(user_id, reached)
             
         except Exception as e:
             logger.error(f"Error tracking collection achievements for user {user_id}: {e}")
@@ -368,11 +399,13 @@ class AchievementManager:
                 'gift_giver': {'type': 'gifts_sent', 'requirement': 10}
             }
             
-            for achievement_id, data in social_achievements.items():
-                if data['type'] == social_type and count >= data['requirement']:
-                    _, unlocked, _ = await self.check_achievement_progress(user_id, achievement_id, count)
-                    if unlocked:
-                        unlocked_achievements.append(achievement_id)
+            reached = {
+                achievement_id: count
+                for achievement_id, data in social_achievements.items()
+                if data['type'] == social_type and count >= data['requirement']
+            }
+            if reached:
+                _, unlocked_achievements = await self._apply_milestones(user_id, reached)
             
         except Exception as e:
             logger.error(f"Error tracking social achievements for user {user_id}: {e}")
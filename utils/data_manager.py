@@ -446,8 +446,7 @@ class DataManager:
     
     async def is_married(self, user_id: int) -> bool:
         """Check if user is married"""
-        marriage_info = await self.marriage.get_marriage_info(user_id)
-        return marriage_info is not None
+        return await self.marriage.is_married(user_id)
     
     async def get_command_cooldown(self, user_id: int, command: str) -> Dict[str, Any]:
         """Get cooldown status for a specific command"""
@@ -74,6 +74,9 @@ class DatabaseManager:
         self.cache_ttl = 300  # 5 minutes
         self.cache_timestamps = {}
         
+        # In-flight user file reads, so concurrent cache misses share one read
+        self._pending_reads: Dict[str, asyncio.Future] = {}
+        
         # Data validation
         self.validator = SchemaValidator()
         
@@ -418,6 +421,18 @@ class DatabaseManager:
         if cached_data is not None:
             return cached_data
         
+        # Join a read that is already loading this file rather than queueing another
+        read = self._pending_reads.get(cache_key)
+        if read is None:
+            read = asyncio.ensure_future(self._load_user_data(user_id, data_type, cache_key))
+            self._pending_reads[cache_key] = read
+            read.add_done_callback(lambda _: self._pending_reads.pop(cache_key, None))
+        
+        # Shielded so one cancelled caller doesn't cancel the read for the others
+        return await asyncio.shield(read)
+    
+    async def _load_user_data(self, user_id: int, data_type: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Read user data from disk and cache it"""
         file_path = self._get_user_file_path(user_id, data_type)
         
         async with self._file_lock(file_path):
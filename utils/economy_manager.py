@@ -5,9 +5,10 @@ Handles all financial operations, transactions, and currency management
 import asyncio
 import logging
 import random
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
 
 from .database_manager import DatabaseManager, DatabaseError
 from .schemas import EconomyData, PrestigeData, ActiveEffects, ItemEffect, SchemaValidator, DEFAULT_ITEMS
@@ -15,12 +16,25 @@ from .schemas import EconomyData, PrestigeData, ActiveEffects, ItemEffect, Schem
 logger = logging.getLogger(__name__)
 
 
+# Features unlocked at each bank tier, indexed by tier - 1
+BANK_TIER_FEATURES = (
+    MappingProxyType({'loan_available': False, 'passive_income_rate': 0}),
+    MappingProxyType({'loan_available': True, 'passive_income_rate': 5}),
+    MappingProxyType({'loan_available': True, 'passive_income_rate': 15, 'investment_access': True}),
+    MappingProxyType({'loan_available': True, 'passive_income_rate': 40, 'investment_access': True,
+                      'premium_services': True}),
+    MappingProxyType({'loan_available': True, 'passive_income_rate': 100, 'investment_access': True,
+                      'premium_services': True, 'vip_status': True}),
+)
+
+
 class TransactionType(Enum):
     """Types of transactions"""
     EARN_WORK = "earn_work"
     EARN_DAILY = "earn_daily"
     EARN_WEEKLY = "earn_weekly"
     EARN_GAMBLING = "earn_gambling"
+    EARN_MINIGAME = "earn_minigame"
     EARN_ACHIEVEMENT = "earn_achievement"
     EARN_LEVEL_UP = "earn_level_up"
     EARN_GIFT = "earn_gift"
@@ -88,14 +102,15 @@ class EconomyManager:
             4: 10000000, # 10M total earned
             5: 50000000  # 50M total earned
         }
-        self.prestige_multipliers = {
-            0: 1.0,   # No prestige
-            1: 1.1,   # +10% earnings
-            2: 1.25,  # +25% earnings
-            3: 1.5,   # +50% earnings
-            4: 2.0,   # +100% earnings
-            5: 3.0    # +200% earnings
-        }
+        # Indexed by prestige level; every level in prestige_requirements has an entry
+        self.prestige_multipliers = (
+            1.0,   # No prestige
+            1.1,   # +10% earnings
+            1.25,  # +25% earnings
+            1.5,   # +50% earnings
+            2.0,   # +100% earnings
+            3.0    # +200% earnings
+        )
         
         # Crime and work settings
         self.crime_base_success_rate = 0.3
@@ -117,8 +132,8 @@ class EconomyManager:
         }
         
         # Bank tier system
-        self.bank_tier_costs = [0, 5000, 25000, 100000, 500000]  # Cost to upgrade to each tier
-        self.bank_tier_capacities = [1000, 10000, 50000, 200000, 1000000]  # Capacity at each tier
+        self.bank_tier_costs = (0, 5000, 25000, 100000, 500000)  # Cost to upgrade to each tier
+        self.bank_tier_capacities = (1000, 10000, 50000, 200000, 1000000)  # Capacity at each tier
     
     async def get_user_economy(self, user_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -156,14 +171,15 @@ class EconomyManager:
         """
         now = datetime.utcnow()
         current_date = now.date()
+        resets = {}
         
         # Check daily reset
         last_daily = economy_data.get('last_daily_time')
         if last_daily:
             last_daily_date = datetime.fromisoformat(last_daily).date()
             if last_daily_date != current_date:
-                economy_data['daily_work_used'] = False
-                economy_data['daily_bonus_claimed'] = False
+                resets['daily_work_used'] = False
+                resets['daily_bonus_claimed'] = False
         
         # Check weekly reset (Monday = 0)
         last_weekly = economy_data.get('last_weekly_time')
@@ -172,17 +188,20 @@ class EconomyManager:
             current_week = current_date.isocalendar()[1]
             last_week = last_weekly_date.isocalendar()[1]
             if current_week != last_week:
-                economy_data['weekly_bonus_claimed'] = False
+                resets['weekly_bonus_claimed'] = False
         
         # Check work cooldown
         last_work = economy_data.get('last_work_time')
         if last_work:
             last_work_time = datetime.fromisoformat(last_work)
             if (now - last_work_time).total_seconds() >= (self.work_cooldown_hours * 3600):
-                economy_data['daily_work_used'] = False
+                resets['daily_work_used'] = False
         
-        # Save updated data
-        await self.db.save_user_data(user_id, 'economy', economy_data)
+        # Only write back when a flag actually flips; balance reads stay in memory otherwise
+        changed = {key: value for key, value in resets.items() if economy_data.get(key) != value}
+        if changed:
+            economy_data.update(changed)
+            await self.db.save_user_data(user_id, 'economy', economy_data)
         return economy_data
     
     async def get_balance(self, user_id: int) -> Tuple[int, int]:
@@ -291,6 +310,69 @@ class EconomyManager:
             logger.error(f"Error removing money for user {user_id}: {e}")
             return False
     
+    async def apply_delta(self, user_id: int, delta: int, location: str = 'pocket',
+                          transaction_type: Optional[TransactionType] = None,
+                          description: str = "Balance adjusted", wager: int = 0) -> bool:
+        """
+        Apply a signed balance change with a single read and write
+        
+        Args:
+            user_id: Discord user ID
+            delta: Amount to add (positive) or remove (negative); zero is a no-op
+            location: 'pocket' or 'bank'
+            transaction_type: Type of transaction (defaults to admin add/remove by sign)
+            description: Transaction description
+            wager: Stake of a settled gambling game; updates the gambling stats
+                and records the game even when it pushes (zero delta)
+            
+        Returns:
+            True if the balance was updated successfully
+        """
+        if delta == 0 and not wager:
+            return True
+        
+        if transaction_type is None:
+            transaction_type = TransactionType.ADMIN_ADD if delta > 0 else TransactionType.ADMIN_REMOVE
+        
+        try:
+            if location not in ('pocket', 'bank'):
+                raise InvalidAmountError("Invalid location. Must be 'pocket' or 'bank'")
+            
+            economy_data = await self.get_user_economy(user_id)
+            if not economy_data:
+                raise DatabaseError(f"Economy data not found for user {user_id}")
+            
+            balance_key = f'{location}_balance'
+            if delta < 0 and economy_data.get(balance_key, 0) < -delta:
+                raise InsufficientFundsError(f"Insufficient funds in {location}")
+            
+            economy_data[balance_key] += delta
+            if delta > 0:
+                economy_data['total_earned'] += delta
+            else:
+                economy_data['total_spent'] -= delta
+            
+            if wager:
+                economy_data['total_gambled'] += wager
+                if delta > 0:
+                    economy_data['total_won'] += delta
+                    economy_data['gambling_streak'] = economy_data.get('gambling_streak', 0) + 1
+                elif delta < 0:
+                    economy_data['gambling_streak'] = 0
+            
+            # Add transaction to history
+            await self._add_transaction(economy_data, transaction_type, delta, description)
+            
+            # Save updated data
+            await self.db.save_user_data(user_id, 'economy', economy_data)
+            
+            logger.debug(f"Applied {delta:+} coins to {location} for user {user_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error applying balance change for user {user_id}: {e}")
+            return False
+    
     async def transfer_money(self, sender_id: int, receiver_id: int, amount: int) -> bool:
         """
         Transfer money between users
@@ -310,8 +392,12 @@ class EconomyManager:
             raise InvalidAmountError("Cannot transfer to yourself")
         
         try:
+            sender_economy, receiver_economy = await asyncio.gather(
+                self.get_user_economy(sender_id),
+                self.get_user_economy(receiver_id)
+            )
+            
             # Check sender has enough money
-            sender_economy = await self.get_user_economy(sender_id)
             if not sender_economy:
                 raise DatabaseError(f"Sender {sender_id} economy data not found")
             
@@ -319,7 +405,6 @@ class EconomyManager:
                 raise InsufficientFundsError("Insufficient funds for transfer")
             
             # Check receiver exists
-            receiver_economy = await self.get_user_economy(receiver_id)
             if not receiver_economy:
                 raise DatabaseError(f"Receiver {receiver_id} economy data not found")
             
@@ -334,9 +419,11 @@ class EconomyManager:
             await self._add_transaction(receiver_economy, TransactionType.TRANSFER_RECEIVE, 
                                       amount, f"Transfer from user {sender_id}")
             
-            # Save both users' data
-            await self.db.save_user_data(sender_id, 'economy', sender_economy)
-            await self.db.save_user_data(receiver_id, 'economy', receiver_economy)
+            # Save both users' data (separate files, so the writes can overlap)
+            await asyncio.gather(
+                self.db.save_user_data(sender_id, 'economy', sender_economy),
+                self.db.save_user_data(receiver_id, 'economy', receiver_economy)
+            )
             
             logger.info(f"Transferred {amount} coins from {sender_id} to {receiver_id}")
             return True
@@ -661,7 +748,7 @@ class EconomyManager:
             tier_info = {
                 'tier': next_tier,
                 'capacity': new_capacity,
-                'features': tier_features,
+                'features': dict(tier_features),
                 'cost': upgrade_cost
             }
             
@@ -672,7 +759,7 @@ class EconomyManager:
             logger.error(f"Error upgrading bank tier for user {user_id}: {e}")
             return False, 0, {'error': str(e)}
     
-    def _get_bank_tier_features(self, tier: int) -> Dict[str, Any]:
+    def _get_bank_tier_features(self, tier: int) -> Mapping[str, Any]:
         """
         Get features unlocked at each bank tier
         
@@ -680,16 +767,11 @@ class EconomyManager:
             tier: Bank tier level
             
         Returns:
-            Dictionary of features and their values
-        """
-        tier_features = {
-            1: {'loan_available': False, 'passive_income_rate': 0},
-            2: {'loan_available': True, 'passive_income_rate': 5},
-            3: {'loan_available': True, 'passive_income_rate': 15, 'investment_access': True},
-            4: {'loan_available': True, 'passive_income_rate': 40, 'investment_access': True, 'premium_services': True},
-            5: {'loan_available': True, 'passive_income_rate': 100, 'investment_access': True, 'premium_services': True, 'vip_status': True}
-        }
-        return tier_features.get(tier, tier_features[1])
+            Read-only mapping of features and their values
+        """
+        if 1 <= tier <= len(BANK_TIER_FEATURES):
+            return BANK_TIER_FEATURES[tier - 1]
+        return BANK_TIER_FEATURES[0]
     
     async def get_loan_eligibility(self, user_id: int) -> Tuple[bool, int, float]:
         """
@@ -1002,6 +1084,38 @@ class EconomyManager:
             logger.error(f"Error getting economy stats for user {user_id}: {e}")
             return {}
     
+    async def get_full_profile(self, user_id: int) -> Dict[str, Any]:
+        """
+        Get economy statistics together with the user's prestige standing
+        
+        Economy and prestige are stored separately, so both are read
+        concurrently and merged into a single result.
+        
+        Args:
+            user_id: Discord user ID
+            
+        Returns:
+            Economy statistics with an added 'prestige' entry, or empty dict if no economy data
+        """
+        try:
+            stats, prestige_data = await asyncio.gather(
+                self.get_economy_stats(user_id),
+                self.get_user_prestige(user_id)
+            )
+            if not stats:
+                return {}
+            
+            prestige_data = prestige_data or {}
+            stats['prestige'] = {
+                'level': prestige_data.get('prestige_level', 0),
+                'multiplier': prestige_data.get('prestige_multiplier', 1.0)
+            }
+            return stats
+            
+        except Exception as e:
+            logger.error(f"Error getting full profile for user {user_id}: {e}")
+            return {}
+    
     async def reset_daily_limits(self, user_id: int) -> bool:
         """
         Reset daily limits for a user (admin function)
@@ -1112,7 +1226,7 @@ class EconomyManager:
             prestige_data['prestige_level'] = next_level
             prestige_data['prestige_points'] += 1
             prestige_data['total_prestiges'] += 1
-            prestige_data['prestige_multiplier'] = self.prestige_multipliers.get(next_level, 1.0)
+            prestige_data['prestige_multiplier'] = self.prestige_multipliers[next_level]
             prestige_data['last_prestige_date'] = datetime.utcnow().isoformat()
             prestige_data['lifetime_earnings_before_prestige'] = total_earned_before
             
@@ -1147,7 +1261,7 @@ class EconomyManager:
             return True, {
                 'new_prestige_level': next_level,
                 'old_prestige_level': old_prestige_level,
-                'prestige_multiplier': self.prestige_multipliers.get(next_level, 1.0),
+                'prestige_multiplier': self.prestige_multipliers[next_level],
                 'starting_balance': 1000,
                 'lifetime_earnings': total_earned_before
             }
@@ -12,7 +12,8 @@ def create_basic_embed(
     color: discord.Color = discord.Color.blue(),
     footer_text: Optional[str] = None,
     thumbnail_url: Optional[str] = None,
-    image_url: Optional[str] = None
+    image_url: Optional[str] = None,
+    timestamp: bool = True
 ) -> discord.Embed:
     """
     Create a basic Discord embed with common formatting
@@ -24,6 +25,8 @@ def create_basic_embed(
         footer_text: Footer text to add
         thumbnail_url: URL for thumbnail image
         image_url: URL for main image
+        timestamp: Stamp the embed with the current time; disable for
+            embeds that are built once and re-sent
     
     Returns:
         discord.Embed: Formatted embed object
@@ -46,7 +49,8 @@ def create_basic_embed(
         embed.set_image(url=image_url)
     
     # Add timestamp
-    embed.timestamp = datetime.utcnow()
+    if timestamp:
+        embed.timestamp = datetime.utcnow()
     
     return embed
 
@@ -60,21 +64,23 @@ def create_success_embed(message: str, title: str = "Success") -> discord.Embed:
     )
 
 
-def create_error_embed(message: str, title: str = "Error") -> discord.Embed:
+def create_error_embed(message: str, title: str = "Error", timestamp: bool = True) -> discord.Embed:
     """Create an error-themed embed"""
     return create_basic_embed(
         title=f"❌ {title}",
         description=message,
-        color=discord.Color.red()
+        color=discord.Color.red(),
+        timestamp=timestamp
     )
 
 
-def create_info_embed(message: str, title: str = "Info") -> discord.Embed:
+def create_info_embed(message: str, title: str = "Info", timestamp: bool = True) -> discord.Embed:
     """Create an info-themed embed"""
     return create_basic_embed(
         title=f"ℹ️ {title}",
         description=message,
-        color=discord.Color.blue()
+        color=discord.Color.blue(),
+        timestamp=timestamp
     )
 
 
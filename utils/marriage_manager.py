@@ -4,6 +4,7 @@ Handles proposals, partnerships, marriages, and relationship benefits
 """
 import asyncio
 import logging
+import time
 import uuid
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
@@ -47,6 +48,12 @@ class MarriageManager:
         self.divorce_cooldown_days = 7
         self.marriage_cost = 1000  # Cost to get married
         
+        # Short-lived marital status cache: user_id -> (checked_at, married)
+        self.married_cache_ttl = 60  # seconds
+        self._married_cache: Dict[int, Tuple[float, bool]] = {}
+        # Bumped on every invalidation so a lookup that raced a marriage change isn't cached
+        self._married_generation: Dict[int, int] = {}
+        
         # Relationship benefits
         self.marriage_benefits = {
             'experience_bonus': 1.1,  # 10% bonus experience
@@ -209,6 +216,7 @@ class MarriageManager:
             # Save relationship data
             await self.db.save_user_data(accepter_id, 'relationships', accepter_rel)
             await self.db.save_user_data(proposer_id, 'relationships', proposer_rel)
+            self._invalidate_married(accepter_id, proposer_id)
             
             # Charge marriage cost
             proposer_economy['pocket_balance'] -= self.marriage_cost
@@ -306,6 +314,7 @@ class MarriageManager:
                 await self.db.save_user_data(partner_id, 'relationships', partner_rel)
             
             await self.db.save_user_data(user_id, 'relationships', user_rel)
+            self._invalidate_married(user_id, partner_id)
             
             logger.info(f"Divorce completed: marriage {marriage_id}")
             return True, "Divorce completed. You are now single. 💔"
@@ -351,6 +360,36 @@ class MarriageManager:
             logger.error(f"Error adding love points: {e}")
             return False
     
+    async def is_married(self, user_id: int) -> bool:
+        """
+        Check whether a user is currently married
+        
+        Results are cached for married_cache_ttl seconds and invalidated
+        whenever this manager marries or divorces the user.
+        
+        Args:
+            user_id: Discord user ID
+            
+        Returns:
+            True if the user has an active marriage
+        """
+        now = time.monotonic()
+        cached = self._married_cache.get(user_id)
+        if cached and now - cached[0] < self.married_cache_ttl:
+            return cached[1]
+        
+        generation = self._married_generation.get(user_id, 0)
+        married = await self.get_marriage_info(user_id) is not None
+        if self._married_generation.get(user_id, 0) == generation:
+            self._married_cache[user_id] = (now, married)
+        return married
+    
+    def _invalidate_married(self, *user_ids: int):
+        """Drop cached marital status for the given users"""
+        for user_id in user_ids:
+            self._married_cache.pop(user_id, None)
+            self._married_generation[user_id] = self._married_generation.get(user_id, 0) + 1
+    
     async def get_marriage_info(self, user_id: int) -> Optional[Dict[str, Any]]:
         """
         Get marriage information for a user
@@ -0,0 +1,35 @@
+"""
+Reusable UI views for FunniGuy Discord Bot
+"""
+import discord
+
+
+class PickView(discord.ui.View):
+    """
+    Button prompt that records a single user's pick and stops
+    
+    Subclasses declare their buttons and call _pick from each callback. The
+    pressing interaction is deferred straight away, so the caller can take as
+    long as it needs before finish() edits in the outcome and removes the
+    buttons.
+    """
+    
+    def __init__(self, user: discord.abc.User, timeout: float = 30.0):
+        super().__init__(timeout=timeout)
+        self.user = user
+        self.choice = None
+        self.interaction = None
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.user.id
+    
+    async def _pick(self, interaction: discord.Interaction, choice: str):
+        # Acknowledge within Discord's 3-second window; the result follows via finish()
+        await interaction.response.defer()
+        self.choice = choice
+        self.interaction = interaction
+        self.stop()
+    
+    async def finish(self, embed: discord.Embed):
+        """Replace the prompt with the result and drop the buttons in one edit"""
+        await self.interaction.edit_original_response(embed=embed, view=None)